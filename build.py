@@ -126,6 +126,14 @@ def clean_old_build() -> None:
             os.remove(spec_file)
             print(f"  ✓ 已删除: {os.path.basename(spec_file)} (Deleted)")
 
+    # 删除翻译文件的pickle缓存，避免被 --add-data 一起打包 (Delete translation caches so they are not bundled)
+    locales_dir = os.path.join(Config.DOWNLOADER_DIR, "locales")
+    if os.path.isdir(locales_dir):
+        for file_name in os.listdir(locales_dir):
+            if file_name.endswith(".json.pkl"):
+                os.remove(os.path.join(locales_dir, file_name))
+                print(f"  ✓ 已删除: {file_name} (Deleted)")
+
     print("✅ 清理完成 (Cleaning completed)")
 
 
@@ -2,6 +2,13 @@
 Main API client for TikHub.io using httpx for synchronous requests
 """
 
+import httpx
+
+try:
+    import orjson as _json_fast
+except ImportError:  # optional speedup
+    _json_fast = None
+
 from downloader.constants import HTTP_CLIENT_USER_AGENT
 from downloader.utils.logger import logger_instance
 from downloader.utils.utils import extract_and_clean_url
@@ -38,6 +45,12 @@ class MainAPIClient:
         # Set the proxy
         self.proxy = proxy or None
 
+        # Shared HTTP client for all API modules: connections stay alive between calls,
+        # so concurrent batch downloads do not pay a TCP/TLS handshake per URL
+        self.http_client = httpx.Client(
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=20)
+        )
+
         # Set up the API clients (Use lazy loading to avoid circular imports)
         from downloader.apis.tikhub.tikhub_api import TikHubAPI
         self.tikhub_api = TikHubAPI(self)
@@ -111,6 +124,26 @@ class MainAPIClient:
             'Connection': 'keep-alive'
         }
 
+    def parse_json(self, response):
+        """Decode a JSON API response
+
+        Uses orjson when installed, so worker threads hold the GIL for a much shorter
+        parse of large payloads; falls back to httpx's json() otherwise.
+
+        Args:
+            response: httpx.Response with a JSON body
+
+        Returns:
+            Decoded JSON data
+        """
+        if _json_fast is not None:
+            try:
+                return _json_fast.loads(response.content)
+            except ValueError:
+                # e.g. integers beyond 64 bits, which orjson rejects but json accepts
+                pass
+        return response.json()
+
     def get_data(self, url: str, clean_data: bool = True):
         """Get the post data from a share URL
 
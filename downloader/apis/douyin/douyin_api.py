@@ -1,5 +1,4 @@
 import re
-import httpx
 from datetime import datetime
 from downloader.apis.api_client import MainAPIClient
 
@@ -27,11 +26,11 @@ class DouyinAPI:
         params = {
             "share_url": share_url
         }
-        with httpx.Client() as client:
-            response = client.get(url, params=params, headers=headers, timeout=30)
-            # 打印日志
-            self.logger.info(f"fetch_one_video_by_share_url_web response code: {response.status_code}")
-            response = response.json()
+        client = self.main_client.http_client
+        response = client.get(url, params=params, headers=headers, timeout=30)
+        # 打印日志
+        self.logger.info(f"fetch_one_video_by_share_url_web response code: {response.status_code}")
+        response = self.main_client.parse_json(response)
         return response
 
     # 根据分享链接获取单个作品数据 App接口/Get single video data by sharing link App API
@@ -42,11 +41,11 @@ class DouyinAPI:
         params = {
             "share_url": share_url
         }
-        with httpx.Client() as client:
-            response = client.get(url, params=params, headers=headers, timeout=30)
-            # 打印日志
-            self.logger.info(f"fetch_one_video_by_share_url_app response code: {response.status_code}")
-            response = response.json()
+        client = self.main_client.http_client
+        response = client.get(url, params=params, headers=headers, timeout=30)
+        # 打印日志
+        self.logger.info(f"fetch_one_video_by_share_url_app response code: {response.status_code}")
+        response = self.main_client.parse_json(response)
         return response
 
     # 获取指定用户的信息 Web接口/Get information of specified user Web API
@@ -57,11 +56,11 @@ class DouyinAPI:
         params = {
             "sec_user_id": sec_user_id
         }
-        with httpx.Client() as client:
-            response = client.get(url, params=params, headers=headers, timeout=30)
-            # 打印日志
-            self.logger.info(f"handler_user_profile_web response code: {response.status_code}")
-            response = response.json()
+        client = self.main_client.http_client
+        response = client.get(url, params=params, headers=headers, timeout=30)
+        # 打印日志
+        self.logger.info(f"handler_user_profile_web response code: {response.status_code}")
+        response = self.main_client.parse_json(response)
         return response
 
     # 获取指定用户的信息 App接口/Get information of specified user App API
@@ -72,11 +71,11 @@ class DouyinAPI:
         params = {
             "sec_user_id": sec_user_id
         }
-        with httpx.Client() as client:
-            response = client.get(url, params=params, headers=headers, timeout=30)
-            # 打印日志
-            self.logger.info(f"handler_user_profile_app response code: {response.status_code}")
-            response = response.json()
+        client = self.main_client.http_client
+        response = client.get(url, params=params, headers=headers, timeout=30)
+        # 打印日志
+        self.logger.info(f"handler_user_profile_app response code: {response.status_code}")
+        response = self.main_client.parse_json(response)
         return response
 
     # 获取用户主页作品数据/Get user homepage video data
@@ -89,11 +88,11 @@ class DouyinAPI:
             "max_cursor": max_cursor,
             "count": count
         }
-        with httpx.Client() as client:
-            response = client.get(url, params=params, headers=headers, timeout=30)
-            # 打印日志
-            self.logger.info(f"fetch_user_post_videos response code: {response.status_code}")
-            response = response.json()
+        client = self.main_client.http_client
+        response = client.get(url, params=params, headers=headers, timeout=30)
+        # 打印日志
+        self.logger.info(f"fetch_user_post_videos response code: {response.status_code}")
+        response = self.main_client.parse_json(response)
         return response
 
     # 获取用户喜欢作品数据/Get user like video data
@@ -106,11 +105,11 @@ class DouyinAPI:
             "max_cursor": max_cursor,
             "count": count
         }
-        with httpx.Client() as client:
-            response = client.get(url, params=params, headers=headers, timeout=30)
-            # 打印日志
-            self.logger.info(f"fetch_user_like_videos response code: {response.status_code}")
-            response = response.json()
+        client = self.main_client.http_client
+        response = client.get(url, params=params, headers=headers, timeout=30)
+        # 打印日志
+        self.logger.info(f"fetch_user_like_videos response code: {response.status_code}")
+        response = self.main_client.parse_json(response)
         return response
 
     # 提取单个用户id/Extract single user id
@@ -121,11 +120,11 @@ class DouyinAPI:
         params = {
             "url": user_url
         }
-        with httpx.Client() as client:
-            response = client.get(url, params=params, headers=headers, timeout=30)
-            # 打印日志
-            self.logger.info(f"get_sec_user_id response code: {response.status_code}")
-            response = response.json()
+        client = self.main_client.http_client
+        response = client.get(url, params=params, headers=headers, timeout=30)
+        # 打印日志
+        self.logger.info(f"get_sec_user_id response code: {response.status_code}")
+        response = self.main_client.parse_json(response)
         return response.get("data", "")
 
     """--------------------------------------以下为工具接口--------------------------------------"""
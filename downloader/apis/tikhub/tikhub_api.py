@@ -1,4 +1,3 @@
-import httpx
 from downloader.apis.api_client import MainAPIClient
 
 
@@ -24,11 +23,11 @@ class TikHubAPI:
         """
         url = f"{self.main_client.base_url}/api/v1/tikhub/user/get_user_info"
         headers = self.main_client.get_headers(api_key)
-        with httpx.Client() as client:
-            response = client.get(url, headers=headers, timeout=10)
-            # 打印日志
-            self.logger.info(f"get_tikhub_user_info response code: {response.status_code}")
-            response = response.json()
+        client = self.main_client.http_client
+        response = client.get(url, headers=headers, timeout=10)
+        # 打印日志
+        self.logger.info(f"get_tikhub_user_info response code: {response.status_code}")
+        response = self.main_client.parse_json(response)
         return response
 
     # 获取用户每日使用情况/Get user daily usage
@@ -41,11 +40,11 @@ class TikHubAPI:
         """
         url = f"{self.main_client.base_url}/api/v1/tikhub/user/get_user_daily_usage"
         headers = self.main_client.get_headers(api_key)
-        with httpx.Client() as client:
-            response = client.get(url, headers=headers, timeout=10)
-            # 打印日志
-            self.logger.info(f"get_user_daily_usage response code: {response.status_code}")
-            response = response.json()
+        client = self.main_client.http_client
+        response = client.get(url, headers=headers, timeout=10)
+        # 打印日志
+        self.logger.info(f"get_user_daily_usage response code: {response.status_code}")
+        response = self.main_client.parse_json(response)
         return response
 
     # 计算价格/Calculate price
@@ -71,11 +70,11 @@ class TikHubAPI:
             "endpoint": endpoint,
             "request_per_day": request_per_day
         }
-        with httpx.Client() as client:
-            response = client.get(url, headers=headers, params=params, timeout=10)
-            # 打印日志
-            self.logger.info(f"calculate_price response code: {response.status_code}")
-            response = response.json()
+        client = self.main_client.http_client
+        response = client.get(url, headers=headers, params=params, timeout=10)
+        # 打印日志
+        self.logger.info(f"calculate_price response code: {response.status_code}")
+        response = self.main_client.parse_json(response)
         return response
 
     # 获取阶梯式折扣百分比信息/Get tiered discount percentage information
@@ -88,11 +87,11 @@ class TikHubAPI:
         """
         url = f"{self.main_client.base_url}/api/v1/tikhub/user/get_tiered_discount_info"
         headers = self.main_client.get_headers(api_key)
-        with httpx.Client() as client:
-            response = client.get(url, headers=headers, timeout=10)
-            # 打印日志
-            self.logger.info(f"get_tiered_discount_info response code: {response.status_code}")
-            response = response.json()
+        client = self.main_client.http_client
+        response = client.get(url, headers=headers, timeout=10)
+        # 打印日志
+        self.logger.info(f"get_tiered_discount_info response code: {response.status_code}")
+        response = self.main_client.parse_json(response)
 
         return response
 
@@ -116,11 +115,11 @@ class TikHubAPI:
         params = {
             "endpoint": endpoint
         }
-        with httpx.Client() as client:
-            response = client.get(url, headers=headers, params=params, timeout=10)
-            # 打印日志
-            self.logger.info(f"get_endpoint_info response code: {response.status_code}")
-            response = response.json()
+        client = self.main_client.http_client
+        response = client.get(url, headers=headers, params=params, timeout=10)
+        # 打印日志
+        self.logger.info(f"get_endpoint_info response code: {response.status_code}")
+        response = self.main_client.parse_json(response)
         return response
 
     # 获取所有端点信息/Get all endpoints information
@@ -133,11 +132,11 @@ class TikHubAPI:
         """
         url = f"{self.main_client.base_url}/api/v1/tikhub/user/get_all_endpoints_info"
         headers = self.main_client.get_headers(api_key)
-        with httpx.Client() as client:
-            response = client.get(url, headers=headers, timeout=10)
-            # 打印日志
-            self.logger.info(f"get_all_endpoints_info response code: {response.status_code}")
-            response = response.json()
+        client = self.main_client.http_client
+        response = client.get(url, headers=headers, timeout=10)
+        # 打印日志
+        self.logger.info(f"get_all_endpoints_info response code: {response.status_code}")
+        response = self.main_client.parse_json(response)
         return response
 
 
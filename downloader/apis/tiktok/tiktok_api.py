@@ -1,5 +1,4 @@
 import re
-import httpx
 from downloader.apis.api_client import MainAPIClient
 from datetime import datetime
 
@@ -26,11 +25,11 @@ class TikTokAPI:
         params = {
             "share_url": share_url
         }
-        with httpx.Client() as client:
-            response = client.get(url, params=params, headers=headers, timeout=30)
-            # 打印日志
-            self.logger.info(f"fetch_one_video_by_share_url_app response code: {response.status_code}")
-            response = response.json()
+        client = self.main_client.http_client
+        response = client.get(url, params=params, headers=headers, timeout=30)
+        # 打印日志
+        self.logger.info(f"fetch_one_video_by_share_url_app response code: {response.status_code}")
+        response = self.main_client.parse_json(response)
         return response
 
     # 获取指定用户的信息 App接口/Get information of specified user App API
@@ -41,11 +40,11 @@ class TikTokAPI:
         params = {
             "sec_user_id": sec_user_id
         }
-        with httpx.Client() as client:
-            response = client.get(url, params=params, headers=headers, timeout=30)
-            # 打印日志
-            self.logger.info(f"handler_user_profile_app response code: {response.status_code}")
-            response = response.json()
+        client = self.main_client.http_client
+        response = client.get(url, params=params, headers=headers, timeout=30)
+        # 打印日志
+        self.logger.info(f"handler_user_profile_app response code: {response.status_code}")
+        response = self.main_client.parse_json(response)
         return response
 
     # 获取用户主页作品数据/Get user homepage video data
@@ -58,11 +57,11 @@ class TikTokAPI:
             "max_cursor": max_cursor,
             "count": count
         }
-        with httpx.Client() as client:
-            response = client.get(url, params=params, headers=headers, timeout=30)
-            # 打印日志
-            self.logger.info(f"fetch_user_post_videos response code: {response.status_code}")
-            response = response.json()
+        client = self.main_client.http_client
+        response = client.get(url, params=params, headers=headers, timeout=30)
+        # 打印日志
+        self.logger.info(f"fetch_user_post_videos response code: {response.status_code}")
+        response = self.main_client.parse_json(response)
         return response
 
     # 获取用户喜欢作品数据/Get user like video data
@@ -75,11 +74,11 @@ class TikTokAPI:
             "max_cursor": max_cursor,
             "count": count
         }
-        with httpx.Client() as client:
-            response = client.get(url, params=params, headers=headers, timeout=30)
-            # 打印日志
-            self.logger.info(f"fetch_user_like_videos response code: {response.status_code}")
-            response = response.json()
+        client = self.main_client.http_client
+        response = client.get(url, params=params, headers=headers, timeout=30)
+        # 打印日志
+        self.logger.info(f"fetch_user_like_videos response code: {response.status_code}")
+        response = self.main_client.parse_json(response)
         return response
 
     # 提取单个用户id/Extract single user id
@@ -90,11 +89,11 @@ class TikTokAPI:
         params = {
             "url": user_url
         }
-        with httpx.Client() as client:
-            response = client.get(url, params=params, headers=headers, timeout=30)
-            # 打印日志
-            self.logger.info(f"get_sec_user_id response code: {response.status_code}")
-            response = response.json()
+        client = self.main_client.http_client
+        response = client.get(url, params=params, headers=headers, timeout=30)
+        # 打印日志
+        self.logger.info(f"get_sec_user_id response code: {response.status_code}")
+        response = self.main_client.parse_json(response)
         return response.get("data", "")
 
     """--------------------------------------以下为工具接口--------------------------------------"""
@@ -9,8 +9,10 @@ import re
 import threading
 import tkinter as tk
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import messagebox
 
+import httpx
 import ttkbootstrap as ttk
 
 from downloader.apis.api_client import MainAPIClient
@@ -67,6 +69,10 @@ class TikHubDownloaderApp:
             proxy=self.config.get('proxy', None)
         )
 
+        # 共享的 HTTP 客户端与单线程 I/O 执行器（如检查更新），在 shutdown 中释放
+        self.http = httpx.Client(timeout=5.0)
+        self.io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tikhub-io")
+
         # Initialize the download path
         self.download_path = self.config.get('download_path', os.path.join(os.getcwd(), "downloads"))
         os.makedirs(self.download_path, exist_ok=True)
@@ -121,7 +127,18 @@ class TikHubDownloaderApp:
         # Enforce window size and position
         self._center_window()
         # Start the Tkinter main loop
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self.shutdown()
+
+    def shutdown(self):
+        """Release the shared HTTP client and I/O executor
+
+        Pending background tasks are cancelled; a running one is not waited for.
+        """
+        self.io_executor.shutdown(wait=False, cancel_futures=True)
+        self.http.close()
 
     def _center_window(self):
         """Center the window on the screen and enforce window size"""
@@ -73,3 +73,13 @@ DEFAULT_VIDEO_HEADERS = {
     'TE': "trailers"
 }
 
+# User agents rotated on download retries to avoid pattern detection by servers
+RETRY_USER_AGENTS = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.0 Safari/605.1.15',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/93.0.4577.63 Safari/537.36',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.159 Safari/537.36',
+)
+
+# Most batch downloads allowed to use the network at once, whatever the worker thread count
+MAX_CONCURRENT_HTTP_DOWNLOADS = 8
@@ -4,18 +4,102 @@ Video and media downloader for TikHub Downloader
 """
 
 import concurrent.futures
+import functools
 import mimetypes
 import os
 import random
 import time
+from collections import namedtuple
+from urllib.parse import urlsplit
 
 import httpx
-from jinja2 import Template
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx (pip install 'httpx[http2]')
+    HAS_HTTP2 = True
+except ImportError:
+    # Fall back to HTTP/1.1 keep-alive connections
+    HAS_HTTP2 = False
 
 from downloader.core.fallback_html_template import fallback_album_template, fallback_mixed_template
-from downloader.constants import DEFAULT_VIDEO_HEADERS
+from downloader.constants import DEFAULT_VIDEO_HEADERS, RETRY_USER_AGENTS
 from downloader.utils.logger import logger_instance
-from downloader.utils.utils import sanitize_filename
+from downloader.utils.utils import natural_sort_key, sanitize_filename
+
+# File extensions shown in album previews
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.webp', '.gif'})
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.mov', '.webm'})
+AUDIO_EXTENSIONS = frozenset({'.mp3', '.m4a', '.wav', '.aac'})
+
+# Mixed content index section for each file extension
+MEDIA_TYPE_BY_EXTENSION = {
+    **dict.fromkeys(IMAGE_EXTENSIONS, 'images'),
+    **dict.fromkeys(VIDEO_EXTENSIONS, 'videos'),
+    **dict.fromkeys(AUDIO_EXTENSIONS, 'audio')
+}
+
+# A single file to fetch for mixed content
+DownloadTask = namedtuple('DownloadTask', 'type url idx ext suffix')
+
+# Exponential backoff multipliers (factor 2.0) for download retries
+_BACKOFF_TABLE = tuple(2.0 ** i for i in range(10))
+
+
+def _backoff(retry_count):
+    """Look up the backoff multiplier for a retry attempt (capped at the last table entry)"""
+    return _BACKOFF_TABLE[min(retry_count, len(_BACKOFF_TABLE) - 1)]
+
+
+def _is_valid_url(url):
+    """Check that a media URL is a non-empty http(s) string"""
+    return isinstance(url, str) and url.startswith('http')
+
+
+@functools.lru_cache(maxsize=4096)
+def _ext_from_url(url_path):
+    """Guess a file extension from the lowercased path of a URL
+
+    Args:
+        url_path: Lowercased URL path, without the query string so that signed CDN URLs share cache entries
+
+    Returns:
+        str: File extension with leading dot, or None if unknown
+    """
+    # Use mimetypes module first
+    ext = mimetypes.guess_extension(mimetypes.guess_type(url_path)[0] or '')
+    if ext and ext != '.jpe':  # Skip .jpe which is sometimes returned for .jpg
+        return ext
+
+    # Fallback to manual checks
+    # Images
+    if '.webp' in url_path:
+        return '.webp'
+    elif '.png' in url_path:
+        return '.png'
+    elif '.jpg' in url_path or '.jpeg' in url_path:
+        return '.jpg'
+    elif '.gif' in url_path:
+        return '.gif'
+
+    # Videos
+    elif '.mp4' in url_path:
+        return '.mp4'
+    elif '.mov' in url_path:
+        return '.mov'
+    elif '.webm' in url_path:
+        return '.webm'
+
+    # Audio
+    elif '.mp3' in url_path:
+        return '.mp3'
+    elif '.m4a' in url_path:
+        return '.m4a'
+    elif '.wav' in url_path:
+        return '.wav'
+    elif '.aac' in url_path:
+        return '.aac'
+
+    return None
 
 
 class VideoDownloader:
@@ -232,6 +316,9 @@ class VideoDownloader:
 </html>
 """
 
+    # Jinja2 environment shared across instances, created on first use
+    _template_env = None
+
     def __init__(self, download_path, use_description=False, skip_existing=True, max_workers=4):
         """Initialize the downloader
 
@@ -246,6 +333,17 @@ class VideoDownloader:
         self.skip_existing = skip_existing
         self.max_workers = max_workers  # New parameter for parallel downloads
 
+        # Shared worker pool for per-file downloads, reused across calls
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='dl')
+
+        # Shared HTTP client so retries and sibling files reuse warm connections.
+        # With HTTP/2 the parallel downloads from one CDN host multiplex over a single connection.
+        self._http_client = httpx.Client(
+            follow_redirects=True,
+            http2=HAS_HTTP2,
+            limits=httpx.Limits(max_connections=max(max_workers, 8), max_keepalive_connections=max(max_workers, 8))
+        )
+
         # Ensure download directory exists
         os.makedirs(self.download_path, exist_ok=True)
 
@@ -258,11 +356,47 @@ class VideoDownloader:
         # Initialize MIME types
         mimetypes.init()
 
+    @classmethod
+    def _get_template_environment(cls):
+        """Get the Jinja2 environment shared by all downloader instances
+
+        Templates are compiled once per process and their bytecode is cached on disk,
+        so creating a downloader per download does not re-parse them.
+
+        Returns:
+            Environment: Jinja2 environment holding the HTML templates
+        """
+        if cls._template_env is None:
+            cls._template_env = Environment(
+                loader=DictLoader({
+                    'album_preview.html': cls.ALBUM_PREVIEW_TEMPLATE,
+                    'mixed_content.html': cls.MIXED_CONTENT_TEMPLATE
+                }),
+                auto_reload=False,  # Sources are constants, never check them for changes
+                bytecode_cache=FileSystemBytecodeCache()
+            )
+        return cls._template_env
+
+    def close(self):
+        """Release the shared HTTP client and the worker pool
+
+        Safe to call more than once. Queued file downloads that have not started are cancelled.
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._http_client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def _init_templates(self):
         """Initialize Jinja2 templates"""
         try:
-            self.album_template = Template(self.ALBUM_PREVIEW_TEMPLATE)
-            self.mixed_template = Template(self.MIXED_CONTENT_TEMPLATE)
+            env = self._get_template_environment()
+            self.album_template = env.get_template('album_preview.html')
+            self.mixed_template = env.get_template('mixed_content.html')
             self.logger.info("Templates initialized successfully")
         except Exception as e:
             self.logger.error(f"Failed to initialize templates: {e}")
@@ -314,7 +448,8 @@ class VideoDownloader:
                 self.logger.error(f"Error in parallel download worker: {e}")
                 return {"success": False, "files": [], "errors": [str(e)]}
 
-        # Use thread pool for parallel downloads
+        # Use a dedicated pool for items: each item submits its files to self._executor,
+        # so running items on the shared pool could exhaust it and deadlock
         with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             future_to_item = {executor.submit(download_item, item): item for item in items}
 
@@ -486,7 +621,7 @@ class VideoDownloader:
         else:
             # Sequential download for single video or if parallel disabled
             for idx, video_url in enumerate(video_urls):
-                if not video_url or not isinstance(video_url, str) or not video_url.startswith('http'):
+                if not _is_valid_url(video_url):
                     self.logger.warning(f"Invalid video URL: {video_url}")
                     continue
 
@@ -515,21 +650,15 @@ class VideoDownloader:
             max_retries: Maximum retry attempts
             result: Result dictionary to be updated
         """
-        valid_urls = [url for url in video_urls if url and isinstance(url, str) and url.startswith('http')]
+        valid_urls = [url for url in video_urls if _is_valid_url(url)]
         total_videos = len(valid_urls)
 
         if not valid_urls:
             self.logger.warning("No valid video URLs found")
             return
 
-        completed = 0
-
-        # Create a progress tracker for overall progress
-        def update_progress():
-            nonlocal completed
-            completed += 1
-            if progress_callback:
-                progress_callback(min(int((completed / total_videos) * 100), 99), 100)
+        # Progress is reported from this thread as downloads complete
+        report_progress = self._make_progress_reporter(progress_callback, total_videos)
 
         # Function to download a single video
         def download_video(idx, url):
@@ -544,28 +673,25 @@ class VideoDownloader:
                     max_retries
                 )
 
-                update_progress()
                 return file_path
             except Exception as e:
                 self.logger.error(f"Error downloading video {idx}: {e}")
-                update_progress()
                 return None
 
         # Initialize progress
         if progress_callback:
             progress_callback(0, 100)
 
-        # Use thread pool for parallel downloads
-        with concurrent.futures.ThreadPoolExecutor(max_workers=min(self.max_workers, total_videos)) as executor:
-            # Submit all download tasks
-            future_to_idx = {executor.submit(download_video, idx, url): idx
-                            for idx, url in enumerate(valid_urls)}
+        # Submit all download tasks to the shared thread pool
+        future_to_idx = {self._executor.submit(download_video, idx, url): idx
+                         for idx, url in enumerate(valid_urls)}
 
-            # Collect results as they complete
-            for future in concurrent.futures.as_completed(future_to_idx):
-                file_path = future.result()
-                if file_path:
-                    result['files'].append(file_path)
+        # Collect results as they complete
+        for completed, future in enumerate(concurrent.futures.as_completed(future_to_idx), 1):
+            file_path = future.result()
+            if file_path:
+                result['files'].append(file_path)
+            report_progress(completed)
 
         # Final progress update
         if progress_callback:
@@ -612,7 +738,7 @@ class VideoDownloader:
         else:
             # Single image download
             image_url = data['image_urls'][0]
-            if not image_url or not isinstance(image_url, str) or not image_url.startswith('http'):
+            if not _is_valid_url(image_url):
                 error_msg = f"Invalid image URL: {image_url}"
                 self.logger.error(error_msg)
                 result['errors'].append(error_msg)
@@ -644,32 +770,18 @@ class VideoDownloader:
             result: Result dictionary to be updated
         """
         # Filter invalid URLs first
-        valid_urls = [url for url in image_urls if url and isinstance(url, str) and url.startswith('http')]
+        valid_urls = [url for url in image_urls if _is_valid_url(url)]
         total_images = len(valid_urls)
 
         if not valid_urls:
             self.logger.warning("No valid image URLs found")
             return
 
-        completed = 0
         download_results = []
 
-        # Create a thread-safe progress tracker that prevents UI updates too frequently
+        # Create a progress reporter that prevents UI updates too frequently
         # to avoid overwhelming the main thread
-        last_update_time = [0]  # Use list for mutable reference in nested function
-        min_update_interval = 0.1  # Minimum seconds between progress updates
-
-        def update_progress():
-            nonlocal completed
-            completed += 1
-
-            # Throttle UI updates to prevent UI freezing
-            current_time = time.time()
-            if progress_callback and (
-                    current_time - last_update_time[0] >= min_update_interval or completed == total_images):
-                progress = min(int((completed / total_images) * 100), 99)
-                progress_callback(progress, 100)
-                last_update_time[0] = current_time
+        report_progress = self._make_progress_reporter(progress_callback, total_images)
 
         # Function to download a single image with better error handling
         def download_image(idx, url):
@@ -688,11 +800,9 @@ class VideoDownloader:
                     max_retries
                 )
 
-                update_progress()
                 return idx, file_path, None  # Success
             except Exception as e:
                 self.logger.error(f"Error downloading image {idx}: {e}")
-                update_progress()
                 return idx, None, str(e)  # Error
 
         # Initialize progress
@@ -702,7 +812,6 @@ class VideoDownloader:
         # Calculate optimal batch size to prevent overwhelming the system
         # This is important for very large image sets
         batch_size = 20  # Default batch size
-        max_workers = min(self.max_workers, 8)  # Cap workers at a reasonable number
 
         # Process in batches for very large image sets
         if total_images > 100:
@@ -712,29 +821,29 @@ class VideoDownloader:
                 batch_end = min(batch_start + batch_size, total_images)
                 batch = valid_urls[batch_start:batch_end]
 
-                with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-                    futures = [executor.submit(download_image, batch_start + i, url) for i, url in enumerate(batch)]
+                futures = [self._executor.submit(download_image, batch_start + i, url) for i, url in enumerate(batch)]
 
-                    for future in concurrent.futures.as_completed(futures):
-                        idx, file_path, error = future.result()
-                        if file_path:
-                            download_results.append((idx, file_path))
-                        elif error:
-                            result['errors'].append(f"Image {idx}: {error}")
+                for completed, future in enumerate(concurrent.futures.as_completed(futures), batch_start + 1):
+                    idx, file_path, error = future.result()
+                    if file_path:
+                        download_results.append((idx, file_path))
+                    elif error:
+                        result['errors'].append(f"Image {idx}: {error}")
+                    report_progress(completed)
 
                 # Short pause between batches to allow system resources to recover
                 time.sleep(0.2)
         else:
             # For smaller image sets, process all at once
-            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures = [executor.submit(download_image, idx, url) for idx, url in enumerate(valid_urls)]
+            futures = [self._executor.submit(download_image, idx, url) for idx, url in enumerate(valid_urls)]
 
-                for future in concurrent.futures.as_completed(futures):
-                    idx, file_path, error = future.result()
-                    if file_path:
-                        download_results.append((idx, file_path))
-                    elif error:
-                        result['errors'].append(f"Image {idx}: {error}")
+            for completed, future in enumerate(concurrent.futures.as_completed(futures), 1):
+                idx, file_path, error = future.result()
+                if file_path:
+                    download_results.append((idx, file_path))
+                elif error:
+                    result['errors'].append(f"Image {idx}: {error}")
+                report_progress(completed)
 
         # Sort results by index to maintain original order
         download_results.sort(key=lambda x: x[0])
@@ -773,7 +882,7 @@ class VideoDownloader:
         else:
             # Sequential download
             for idx, audio_url in enumerate(audio_urls):
-                if not audio_url or not isinstance(audio_url, str) or not audio_url.startswith('http'):
+                if not _is_valid_url(audio_url):
                     self.logger.warning(f"Invalid audio URL: {audio_url}")
                     continue
 
@@ -806,21 +915,15 @@ class VideoDownloader:
             result: Result dictionary to be updated
         """
         # Implementation similar to _parallel_process_videos but for audio files
-        valid_urls = [url for url in audio_urls if url and isinstance(url, str) and url.startswith('http')]
+        valid_urls = [url for url in audio_urls if _is_valid_url(url)]
         total_audio = len(valid_urls)
 
         if not valid_urls:
             self.logger.warning("No valid audio URLs found")
             return
 
-        completed = 0
-
-        # Create a progress tracker for overall progress
-        def update_progress():
-            nonlocal completed
-            completed += 1
-            if progress_callback:
-                progress_callback(min(int((completed / total_audio) * 100), 99), 100)
+        # Progress is reported from this thread as downloads complete
+        report_progress = self._make_progress_reporter(progress_callback, total_audio)
 
         # Function to download a single audio file
         def download_audio(idx, url):
@@ -838,28 +941,25 @@ class VideoDownloader:
                     max_retries
                 )
 
-                update_progress()
                 return file_path
             except Exception as e:
                 self.logger.error(f"Error downloading audio {idx}: {e}")
-                update_progress()
                 return None
 
         # Initialize progress
         if progress_callback:
             progress_callback(0, 100)
 
-        # Use thread pool for parallel downloads
-        with concurrent.futures.ThreadPoolExecutor(max_workers=min(self.max_workers, total_audio)) as executor:
-            # Submit all download tasks
-            future_to_idx = {executor.submit(download_audio, idx, url): idx
-                            for idx, url in enumerate(valid_urls)}
+        # Submit all download tasks to the shared thread pool
+        future_to_idx = {self._executor.submit(download_audio, idx, url): idx
+                         for idx, url in enumerate(valid_urls)}
 
-            # Collect results as they complete
-            for future in concurrent.futures.as_completed(future_to_idx):
-                file_path = future.result()
-                if file_path:
-                    result['files'].append(file_path)
+        # Collect results as they complete
+        for completed, future in enumerate(concurrent.futures.as_completed(future_to_idx), 1):
+            file_path = future.result()
+            if file_path:
+                result['files'].append(file_path)
+            report_progress(completed)
 
         # Final progress update
         if progress_callback:
@@ -910,7 +1010,7 @@ class VideoDownloader:
             # Process videos
             if data.get('video_urls'):
                 for idx, video_url in enumerate(data['video_urls']):
-                    if not video_url or not isinstance(video_url, str) or not video_url.startswith('http'):
+                    if not _is_valid_url(video_url):
                         self.logger.warning(f"Invalid video URL: {video_url}")
                         current_item += 1
                         continue
@@ -950,112 +1050,109 @@ class VideoDownloader:
             max_retries: Maximum retry attempts
             result: Result dictionary to be updated
         """
-        # Prepare download tasks for all media types
-        download_tasks = []
-
-        # Add video tasks
-        for idx, url in enumerate(data.get('video_urls', [])):
-            if url and isinstance(url, str) and url.startswith('http'):
-                download_tasks.append({
-                    'type': 'video',
-                    'url': url,
-                    'idx': idx,
-                    'ext': '.mp4',
-                    'suffix': '_video'
-                })
-
-        # Add image tasks
-        for idx, url in enumerate(data.get('image_urls', [])):
-            if url and isinstance(url, str) and url.startswith('http'):
-                ext = self._determine_file_extension(url, '.jpg')
-                download_tasks.append({
-                    'type': 'image',
-                    'url': url,
-                    'idx': idx,
-                    'ext': ext,
-                    'suffix': '_image'
-                })
-
-        # Add audio tasks
-        for idx, url in enumerate(data.get('audio_urls', [])):
-            if url and isinstance(url, str) and url.startswith('http'):
-                ext = self._determine_file_extension(url, '.mp3')
-                download_tasks.append({
-                    'type': 'audio',
-                    'url': url,
-                    'idx': idx,
-                    'ext': ext,
-                    'suffix': '_audio'
-                })
-
-        # Add music tasks
-        if data.get('music_id'):
-            for idx, url in enumerate(data.get('music_urls', [])):
-                if url and isinstance(url, str) and url.startswith('http'):
-                    ext = self._determine_file_extension(url, '.mp3')
-                    download_tasks.append({
-                        'type': 'music',
-                        'url': url,
-                        'idx': idx,
-                        'ext': ext,
-                        'suffix': '_music'
-                    })
+        # Prepare download tasks for all media types in a single validated pass
+        download_tasks = list(self._iter_mixed_tasks(data))
 
         total_tasks = len(download_tasks)
         if total_tasks == 0:
             self.logger.warning("No valid media URLs found in mixed content")
             return
 
-        completed = 0
-
-        # Progress update function
-        def update_progress():
-            nonlocal completed
-            completed += 1
-            if progress_callback:
-                progress_callback(min(int((completed / total_tasks) * 100), 99), 100)
+        # Progress is reported from this thread as downloads complete
+        report_progress = self._make_progress_reporter(progress_callback, total_tasks)
 
         # Function to download a single media item
         def download_media_item(task):
             try:
                 file_path = self._download_media_file(
                     data,
-                    task['url'],
+                    task.url,
                     mixed_dir,
-                    task['ext'],
-                    task['idx'],
+                    task.ext,
+                    task.idx,
                     None,  # No individual progress callback
                     max_retries,
-                    task['suffix']
+                    task.suffix
                 )
 
-                update_progress()
                 return file_path
             except Exception as e:
-                self.logger.error(f"Error downloading {task['type']} {task['idx']}: {e}")
-                update_progress()
+                self.logger.error(f"Error downloading {task.type} {task.idx}: {e}")
                 return None
 
         # Initialize progress
         if progress_callback:
             progress_callback(0, 100)
 
-        # Use thread pool for parallel downloads
-        with concurrent.futures.ThreadPoolExecutor(max_workers=min(self.max_workers, total_tasks)) as executor:
-            # Submit all download tasks
-            future_to_task = {executor.submit(download_media_item, task): task
-                             for task in download_tasks}
+        # Submit all download tasks to the shared thread pool
+        future_to_task = {self._executor.submit(download_media_item, task): task
+                          for task in download_tasks}
 
-            # Collect results as they complete
-            for future in concurrent.futures.as_completed(future_to_task):
-                file_path = future.result()
-                if file_path:
-                    result['files'].append(file_path)
+        # Collect results as they complete
+        for completed, future in enumerate(concurrent.futures.as_completed(future_to_task), 1):
+            file_path = future.result()
+            if file_path:
+                result['files'].append(file_path)
+            report_progress(completed)
 
         # Final progress update
         if progress_callback:
             progress_callback(100, 100)
 
+    def _iter_mixed_tasks(self, data):
+        """Yield a download task for every valid URL in mixed content
+
+        Args:
+            data: Content data dictionary
+
+        Yields:
+            DownloadTask: Task describing a single media file
+        """
+        media_sources = [
+            ('video', data.get('video_urls', []), '.mp4', '_video'),
+            ('image', data.get('image_urls', []), '.jpg', '_image'),
+            ('audio', data.get('audio_urls', []), '.mp3', '_audio'),
+        ]
+        if data.get('music_id'):
+            media_sources.append(('music', data.get('music_urls', []), '.mp3', '_music'))
+
+        for media_type, urls, default_ext, suffix in media_sources:
+            for idx, url in enumerate(urls):
+                if not _is_valid_url(url):
+                    continue
+                ext = default_ext if media_type == 'video' else self._determine_file_extension(url, default_ext)
+                yield DownloadTask(media_type, url, idx, ext, suffix)
+
+    def _make_progress_reporter(self, progress_callback, total, min_interval=0.1):
+        """Create a throttled progress reporter for parallel downloads
+
+        The reporter is called from the collecting thread with the number of
+        finished tasks, so progress is always monotonic.
+
+        Args:
+            progress_callback: Progress reporting callback (may be None)
+            total: Total number of tasks
+            min_interval: Minimum seconds between progress updates
+
+        Returns:
+            callable: Function taking the number of completed tasks
+        """
+        last_update_time = [0.0]  # Use list for mutable reference in nested function
+
+        def report_progress(completed):
+            if not progress_callback:
+                return
+
+            # Throttle UI updates, but always report the last completion
+            current_time = time.monotonic()
+            if completed < total and current_time - last_update_time[0] < min_interval:
+                return
+            last_update_time[0] = current_time
+
+            progress_callback(min(int((completed / total) * 100), 99), 100)
+
+        return report_progress
+
     def _get_content_name(self, data):
         """Generate a standardized content name from data
 
@@ -1065,21 +1162,31 @@ class VideoDownloader:
         Returns:
             str: Sanitized name for files/folders
         """
+        # Reuse the name computed for this content (one sanitize pass per post, not per file)
+        cached = data.get('_cached_name')
+        if cached and cached[0] == self.use_description:
+            return cached[1]
+
         content_id = data['id']
         platform = data.get('platform', 'unknown')
+        name = None
 
         if self.use_description and data.get('desc'):
             desc = data['desc']
             safe_desc = sanitize_filename(desc, max_length=50)
             if safe_desc:
-                return f"{safe_desc}_{content_id}"
+                name = f"{safe_desc}_{content_id}"
+
+        if name is None:
+            # Include platform and author if available
+            author_part = ""
+            if data.get('author_name'):
+                author_part = f"_{sanitize_filename(data['author_name'], max_length=15)}"
 
-        # Include platform and author if available
-        author_part = ""
-        if data.get('author_name'):
-            author_part = f"_{sanitize_filename(data['author_name'], max_length=15)}"
+            name = f"{platform}{author_part}_{content_id}"
 
-        return f"{platform}{author_part}_{content_id}"
+        data['_cached_name'] = (self.use_description, name)
+        return name
 
     def _determine_file_extension(self, url, default_ext, content_type=None):
         """Enhanced file extension detection using URL and content-type
@@ -1117,42 +1224,10 @@ class VideoDownloader:
 
         # If couldn't determine from content-type, try from URL
         if url:
-            lower_url = url.lower()
-
-            # Use mimetypes module first
-            ext = mimetypes.guess_extension(mimetypes.guess_type(url)[0] or '')
-            if ext and ext != '.jpe':  # Skip .jpe which is sometimes returned for .jpg
+            ext = _ext_from_url(urlsplit(url).path.lower())
+            if ext:
                 return ext
 
-            # Fallback to manual checks
-            # Images
-            if '.webp' in lower_url:
-                return '.webp'
-            elif '.png' in lower_url:
-                return '.png'
-            elif '.jpg' in lower_url or '.jpeg' in lower_url:
-                return '.jpg'
-            elif '.gif' in lower_url:
-                return '.gif'
-
-            # Videos
-            elif '.mp4' in lower_url:
-                return '.mp4'
-            elif '.mov' in lower_url:
-                return '.mov'
-            elif '.webm' in lower_url:
-                return '.webm'
-
-            # Audio
-            elif '.mp3' in lower_url:
-                return '.mp3'
-            elif '.m4a' in lower_url:
-                return '.m4a'
-            elif '.wav' in lower_url:
-                return '.wav'
-            elif '.aac' in lower_url:
-                return '.aac'
-
         # Default extension if couldn't determine
         return default_ext
 
@@ -1162,7 +1237,7 @@ class VideoDownloader:
 
         Args:
             data: Content data dictionary
-            url: URL to download
+            url: URL to download (validated by the caller)
             output_dir: Directory to save the file
             extension: File extension (with dot)
             index: Optional index for multi-file content
@@ -1173,11 +1248,8 @@ class VideoDownloader:
         Returns:
             str: Path to downloaded file or None if failed
         """
-        # Validate URL
-        if not url or not isinstance(url, str) or not url.startswith('http'):
-            self.logger.error(f"Invalid URL: {url}")
-            return None
-
+        # URLs are validated by the callers before dispatch
+        part_file = None
         try:
             # Generate base filename
             base_name = self._get_content_name(data)
@@ -1190,8 +1262,9 @@ class VideoDownloader:
             if suffix:
                 base_name = f"{base_name}{suffix}"
 
-            # Complete filename with extension
-            file_name = os.path.join(output_dir, f"{base_name}{extension}")
+            # Derive the output paths once; only the extension may change later
+            base_path = os.path.join(output_dir, base_name)
+            file_name = base_path + extension
 
             # Skip if file exists and skip_existing is True
             if self.skip_existing and os.path.exists(file_name):
@@ -1202,22 +1275,24 @@ class VideoDownloader:
             if progress_callback:
                 progress_callback(0, 100)
 
-            # Create a temporary file for partial downloads
-            temp_file = f"{file_name}.part"
+            # Create (or reopen) a temporary file for partial downloads, kept open across retries
+            temp_file = file_name + '.part'
+            part_file = self._open_temp_file(temp_file)
 
             # Track where to resume download if supported
-            resume_position = 0
-            if os.path.exists(temp_file):
-                resume_position = os.path.getsize(temp_file)
+            resume_position = os.fstat(part_file.fileno()).st_size
+
+            # Prepare headers once; retries only update Range and User-Agent
+            headers = DEFAULT_VIDEO_HEADERS.copy()
 
             # Download with retry logic and exponential backoff
+            client = self._http_client
             retry_count = 0
-            backoff_factor = 2.0  # Increased for more effective backoff
 
             while retry_count < max_retries:
                 try:
                     # Configure appropriate timeouts based on media type
-                    if extension in ['.mp4', '.mov', '.webm']:
+                    if extension in VIDEO_EXTENSIONS:
                         # Longer timeouts for video
                         timeout_settings = httpx.Timeout(
                             connect=15.0,
@@ -1234,148 +1309,155 @@ class VideoDownloader:
                             pool=5.0
                         )
 
-                    # Prepare headers with resume capability
-                    headers = DEFAULT_VIDEO_HEADERS.copy()
-                    if resume_position > 0:
-                        headers['Range'] = f'bytes={resume_position}-'
+                    # Resume from the current partial file size
+                    headers['Range'] = f'bytes={resume_position}-'
 
                     # Add randomized User-Agent to avoid pattern detection by servers
                     # This helps prevent rate limiting when downloading many files
                     if retry_count > 0:
                         # Rotate user agents to reduce risk of being blocked
-                        user_agents = [
-                            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.0 Safari/605.1.15',
-                            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/93.0.4577.63 Safari/537.36',
-                            'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.159 Safari/537.36',
-                        ]
-                        headers['User-Agent'] = user_agents[retry_count % len(user_agents)]
-
-                    with httpx.Client(timeout=timeout_settings, follow_redirects=True) as client:
-                        with client.stream("GET", url, headers=headers) as response:
-                            # Check for success response
-                            if response.status_code in (200, 206):  # OK or Partial Content
-                                # Update file extension based on content-type if needed
-                                content_type = response.headers.get('content-type')
-                                detected_ext = self._determine_file_extension(url, extension, content_type)
-
-                                if detected_ext != extension:
-                                    # Update file name with correct extension
-                                    new_file_name = os.path.join(output_dir, f"{base_name}{detected_ext}")
-                                    new_temp_file = f"{new_file_name}.part"
-
-                                    # If we already have a temp file, rename it
-                                    if os.path.exists(temp_file):
-                                        os.rename(temp_file, new_temp_file)
-
-                                    file_name = new_file_name
-                                    temp_file = new_temp_file
-                                    extension = detected_ext
-
-                                # Get total size if available
-                                total_size = int(response.headers.get('content-length', 0))
-                                if response.status_code == 206:  # Partial content
-                                    # Adjust total size for resumed downloads
-                                    content_range = response.headers.get('content-range', '')
-                                    if content_range and '/' in content_range:
-                                        try:
-                                            total_size = int(content_range.split('/')[1])
-                                        except (ValueError, IndexError):
-                                            # Fall back to adding content-length to resume position
-                                            total_size += resume_position
-                                    else:
+                        headers['User-Agent'] = RETRY_USER_AGENTS[retry_count % len(RETRY_USER_AGENTS)]
+
+                    with client.stream("GET", url, headers=headers, timeout=timeout_settings) as response:
+                        # Check for success response
+                        if response.status_code in (200, 206):  # OK or Partial Content
+                            # Update file extension based on content-type if needed
+                            content_type = response.headers.get('content-type')
+                            detected_ext = self._determine_file_extension(url, extension, content_type)
+
+                            if detected_ext != extension:
+                                # Update file name with correct extension
+                                new_file_name = base_path + detected_ext
+                                new_temp_file = new_file_name + '.part'
+
+                                # Rename the temp file (Windows cannot rename an open file, so reopen it)
+                                part_file.close()
+                                os.replace(temp_file, new_temp_file)
+
+                                file_name = new_file_name
+                                temp_file = new_temp_file
+                                extension = detected_ext
+                                part_file = self._open_temp_file(temp_file)
+
+                            # Get total size if available
+                            total_size = int(response.headers.get('content-length', 0))
+                            if response.status_code == 206:  # Partial content
+                                # Adjust total size for resumed downloads
+                                content_range = response.headers.get('content-range', '')
+                                if content_range and '/' in content_range:
+                                    try:
+                                        total_size = int(content_range.split('/')[1])
+                                    except (ValueError, IndexError):
+                                        # Fall back to adding content-length to resume position
                                         total_size += resume_position
-
-                                # Adjust chunk size based on file type and size for better performance
-                                if extension in ['.mp4', '.mov', '.webm']:
-                                    # Larger chunks for video
-                                    chunk_size = 16384
-                                elif total_size > 5 * 1024 * 1024:  # > 5MB
-                                    # Medium chunks for large images
-                                    chunk_size = 8192
                                 else:
-                                    # Smaller chunks for typical images
-                                    chunk_size = 4096
-
-                                # Open file for writing/appending
-                                mode = 'ab' if resume_position > 0 else 'wb'
-                                with open(temp_file, mode) as f:
-                                    downloaded = resume_position
-                                    last_progress_update = time.time()
-
-                                    for chunk in response.iter_bytes(chunk_size=chunk_size):
-                                        if chunk:
-                                            f.write(chunk)
-                                            downloaded += len(chunk)
-
-                                            # Update progress at most every 100ms to avoid UI freezing
-                                            current_time = time.time()
-                                            if progress_callback and total_size > 0 and (
-                                                    current_time - last_progress_update >= 0.1):
-                                                progress = int((downloaded / total_size) * 100)
-                                                progress_callback(progress, 100)
-                                                last_progress_update = current_time
-
-                                # Success: rename temp file to final filename
-                                os.replace(temp_file, file_name)
-
-                                # Final progress update
-                                if progress_callback:
-                                    progress_callback(100, 100)
-
-                                return file_name
-
-                            # Handle specific errors
-                            elif response.status_code == 429:  # Too Many Requests
-                                # Wait longer for rate limit errors
-                                retry_delay = (backoff_factor ** retry_count) * 5 + (random.random() * 2)  # Add jitter
-                                self.logger.warning(
-                                    f"Rate limited. Retrying in {retry_delay:.1f}s... ({retry_count + 1}/{max_retries})")
-                                time.sleep(retry_delay)
-
-                            elif response.status_code == 504:  # Gateway Timeout
-                                # For timeout errors, wait before retrying
-                                retry_delay = (backoff_factor ** retry_count) * 3
-                                self.logger.warning(
-                                    f"Gateway timeout. Retrying in {retry_delay:.1f}s... ({retry_count + 1}/{max_retries})")
-                                time.sleep(retry_delay)
-
-                            elif 500 <= response.status_code < 600:  # Server errors
-                                # For other server errors, wait a bit
-                                retry_delay = (backoff_factor ** retry_count) * 2
-                                self.logger.warning(
-                                    f"Server error {response.status_code}. Retrying in {retry_delay:.1f}s... ({retry_count + 1}/{max_retries})")
-                                time.sleep(retry_delay)
+                                    total_size += resume_position
+
+                            # Adjust chunk size based on file type and size for better performance.
+                            # Socket reads release the GIL; bigger chunks mean fewer trips back into
+                            # the interpreter, so concurrent batch workers overlap their I/O better
+                            if extension in VIDEO_EXTENSIONS and total_size > 10 * 1024 * 1024:  # > 10MB
+                                # Large chunks for big videos to cut per-chunk interpreter overhead;
+                                # matching the 1MB file buffer lets each chunk go straight to write()
+                                chunk_size = 1024 * 1024
+                            elif extension in VIDEO_EXTENSIONS:
+                                # Larger chunks for video
+                                chunk_size = 65536
+                            elif total_size > 5 * 1024 * 1024:  # > 5MB
+                                # Medium chunks for large images
+                                chunk_size = 65536
+                            else:
+                                # Smaller chunks for typical images
+                                chunk_size = 16384
 
+                            # Append to the partial file, or start over if the server sent the full body
+                            if response.status_code == 206:
+                                part_file.seek(resume_position)
+                                downloaded = resume_position
                             else:
-                                # Other errors are not retried
-                                self.logger.error(f"HTTP error {response.status_code} when downloading media")
-                                break  # Exit retry loop for non-retriable errors
+                                part_file.seek(0)
+                                part_file.truncate()
+                                downloaded = 0
+
+                            last_progress_update = time.time()
+
+                            for chunk in response.iter_bytes(chunk_size=chunk_size):
+                                if chunk:
+                                    part_file.write(chunk)
+                                    downloaded += len(chunk)
+
+                                    # Update progress at most every 100ms to avoid UI freezing
+                                    current_time = time.time()
+                                    if progress_callback and total_size > 0 and (
+                                            current_time - last_progress_update >= 0.1):
+                                        progress = int((downloaded / total_size) * 100)
+                                        progress_callback(progress, 100)
+                                        last_progress_update = current_time
+
+                            # Keep large videos from flooding the page cache during batches
+                            if extension in VIDEO_EXTENSIONS:
+                                self._release_page_cache(part_file)
+
+                            # Success: close and rename temp file to final filename
+                            part_file.close()
+                            os.replace(temp_file, file_name)
+
+                            # Final progress update
+                            if progress_callback:
+                                progress_callback(100, 100)
+
+                            return file_name
+
+                        # Handle specific errors
+                        elif response.status_code == 429:  # Too Many Requests
+                            # Wait longer for rate limit errors
+                            retry_delay = _backoff(retry_count) * 5 + (random.random() * 2)  # Add jitter
+                            self.logger.warning(
+                                f"Rate limited. Retrying in {retry_delay:.1f}s... ({retry_count + 1}/{max_retries})")
+                            time.sleep(retry_delay)
+
+                        elif response.status_code == 504:  # Gateway Timeout
+                            # For timeout errors, wait before retrying
+                            retry_delay = _backoff(retry_count) * 3
+                            self.logger.warning(
+                                f"Gateway timeout. Retrying in {retry_delay:.1f}s... ({retry_count + 1}/{max_retries})")
+                            time.sleep(retry_delay)
+
+                        elif 500 <= response.status_code < 600:  # Server errors
+                            # For other server errors, wait a bit
+                            retry_delay = _backoff(retry_count) * 2
+                            self.logger.warning(
+                                f"Server error {response.status_code}. Retrying in {retry_delay:.1f}s... ({retry_count + 1}/{max_retries})")
+                            time.sleep(retry_delay)
+
+                        else:
+                            # Other errors are not retried
+                            self.logger.error(f"HTTP error {response.status_code} when downloading media")
+                            break  # Exit retry loop for non-retriable errors
 
                 except (httpx.TimeoutException, httpx.ConnectTimeout) as e:
-                    # Update resume position if file exists
-                    if os.path.exists(temp_file):
-                        resume_position = os.path.getsize(temp_file)
+                    # Resume from whatever reached the temp file
+                    part_file.flush()
+                    resume_position = os.fstat(part_file.fileno()).st_size
 
-                    retry_delay = (backoff_factor ** retry_count) * 3 + (random.random() * 1.5)  # Add jitter
+                    retry_delay = _backoff(retry_count) * 3 + (random.random() * 1.5)  # Add jitter
                     self.logger.warning(
                         f"Timeout error: {e}. Retrying in {retry_delay:.1f}s... ({retry_count + 1}/{max_retries})")
                     time.sleep(retry_delay)
 
                 except (httpx.NetworkError, httpx.ProtocolError) as e:
-                    # Update resume position if file exists
-                    if os.path.exists(temp_file):
-                        resume_position = os.path.getsize(temp_file)
+                    # Resume from whatever reached the temp file
+                    part_file.flush()
+                    resume_position = os.fstat(part_file.fileno()).st_size
 
-                    retry_delay = (backoff_factor ** retry_count) * 2 + (random.random() * 1)  # Add jitter
+                    retry_delay = _backoff(retry_count) * 2 + (random.random() * 1)  # Add jitter
                     self.logger.warning(
                         f"Network error: {e}. Retrying in {retry_delay:.1f}s... ({retry_count + 1}/{max_retries})")
                     time.sleep(retry_delay)
 
                 except Exception as e:
                     self.logger.error(f"Unexpected error downloading media: {e}")
-                    if os.path.exists(temp_file):
-                        os.remove(temp_file)  # Clean up temp file on unexpected errors
+                    self._discard_temp_file(part_file, temp_file)  # Clean up temp file on unexpected errors
                     return None
 
                 # Increment retry counter
@@ -1383,18 +1465,58 @@ class VideoDownloader:
 
             # If we reach here, all retries failed
             self.logger.error(f"Failed to download media after {max_retries} attempts")
-            if os.path.exists(temp_file):
-                os.remove(temp_file)  # Clean up temp file
+            self._discard_temp_file(part_file, temp_file)  # Clean up temp file
             return None
 
         except Exception as e:
             self.logger.error(f"Error in _download_media_file: {e}")
             # Clean up any temp file
-            temp_file = f"{file_name}.part" if 'file_name' in locals() else None
-            if temp_file and os.path.exists(temp_file):
-                os.remove(temp_file)
+            if part_file is not None:
+                self._discard_temp_file(part_file, temp_file)
             return None
 
+    def _open_temp_file(self, temp_file):
+        """Open a partial-download file for read/write, creating it if needed
+
+        Args:
+            temp_file: Path of the .part file
+
+        Returns:
+            file: Binary file object positioned at the start of the file
+        """
+        fd = os.open(temp_file, os.O_RDWR | os.O_CREAT | getattr(os, 'O_BINARY', 0), 0o644)
+        # 1MB write buffer so small chunks coalesce into fewer write() calls
+        return open(fd, 'r+b', buffering=1024 * 1024, closefd=True)
+
+    def _discard_temp_file(self, part_file, temp_file):
+        """Close and delete a partial-download file
+
+        Args:
+            part_file: Open file object of the partial download
+            temp_file: Path of the .part file
+        """
+        part_file.close()
+        try:
+            os.remove(temp_file)
+        except FileNotFoundError:
+            pass
+
+    def _release_page_cache(self, f):
+        """Ask the OS to drop cached pages of a fully written file
+
+        Args:
+            f: Open binary file object that has been completely written
+        """
+        if not hasattr(os, 'posix_fadvise'):  # Not available on Windows/macOS
+            return
+
+        try:
+            f.flush()
+            os.fdatasync(f.fileno())  # Dirty pages cannot be dropped until written back
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError as e:
+            self.logger.debug(f"Could not release page cache: {e}")
+
     def _create_album_preview(self, album_dir, data):
         """Create an HTML preview for downloaded album using Jinja2 templates
 
@@ -1450,16 +1572,12 @@ class VideoDownloader:
         Returns:
             list: List of image filenames
         """
-        image_files = []
-        for file in os.listdir(directory):
-            lower_file = file.lower()
-            if (lower_file.endswith('.jpg') or lower_file.endswith('.jpeg') or
-                lower_file.endswith('.png') or lower_file.endswith('.webp') or
-                lower_file.endswith('.gif')):
-                image_files.append(file)
-
-        # Sort image files numerically if possible
-        image_files.sort()
+        with os.scandir(directory) as entries:
+            image_files = [entry.name for entry in entries
+                           if entry.is_file() and os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS]
+
+        # Sort image files numerically so "_10" follows "_9"
+        image_files.sort(key=natural_sort_key)
         return image_files
 
     def _create_mixed_content_index(self, mixed_dir, data, file_paths):
@@ -1525,36 +1643,29 @@ class VideoDownloader:
         """
         media_files = {}  # Group by type
 
-        for file_path in file_paths:
-            if directory in file_path and os.path.exists(file_path):
-                file_name = os.path.basename(file_path)
-                lower_file = file_name.lower()
+        # One directory scan instead of a stat per file; also rejects sibling directories
+        # that merely share the directory name as a prefix
+        with os.scandir(directory) as entries:
+            existing_files = {os.path.join(directory, entry.name): entry.name for entry in entries if entry.is_file()}
+
+        # Sort once up front; appending in this order keeps every bucket sorted
+        for file_path in sorted(file_paths, key=os.path.basename):
+            file_name = existing_files.get(file_path)
+            if file_name:
+                # Lowercase only the extension, not the whole (possibly long) file name
+                dot = file_name.rfind('.')
+                ext = file_name[dot:].lower() if dot >= 0 else ''
 
                 # Skip HTML files
-                if lower_file.endswith('.html'):
+                if ext == '.html':
                     continue
 
                 # Categorize by file type
-                if lower_file.endswith(('.jpg', '.jpeg', '.png', '.webp', '.gif')):
-                    media_type = 'images'
-                elif lower_file.endswith(('.mp4', '.mov', '.webm')):
-                    media_type = 'videos'
-                elif lower_file.endswith(('.mp3', '.m4a', '.wav', '.aac')):
-                    if '_music' in lower_file:
-                        media_type = 'music'
-                    else:
-                        media_type = 'audio'
-                else:
-                    media_type = 'other'
-
-                if media_type not in media_files:
-                    media_files[media_type] = []
-
-                media_files[media_type].append(file_name)
+                media_type = MEDIA_TYPE_BY_EXTENSION.get(ext, 'other')
+                if media_type == 'audio' and '_music' in file_name.lower():
+                    media_type = 'music'
 
-        # Sort each category
-        for media_type in media_files:
-            media_files[media_type].sort()
+                media_files.setdefault(media_type, []).append(file_name)
 
         return media_files
 
@@ -1,227 +1,227 @@
 # Fallback methods for HTML generation (used if Jinja2 templates fail to initialize)
-def fallback_album_template(context):
-    """Simple string-based template for album preview"""
-    album_name = context['album_name']
-    platform = context['platform']
-    author = context['author']
-    description = context.get('description', '')
-    image_files = context['image_files']
+#
+# These use a minimal standalone Jinja2 environment (no loader, no bytecode cache),
+# so they keep working when the downloader's shared environment cannot be set up.
+# The templates are compiled once at import and only rendered afterwards.
 
-    html_content = f"""<!DOCTYPE html>
-<html>
-<head>
-<meta charset="UTF-8">
-<meta name="viewport" content="width=device-width, initial-scale=1.0">
-<title>{album_name}</title>
-<style>
-    body {{
+from jinja2 import BaseLoader, Environment
+
+# Output matches the downloader's own templates, which do not autoescape
+_env = Environment(loader=BaseLoader(), autoescape=False, cache_size=-1, auto_reload=False)
+
+# Stylesheets of the fallback pages (plain strings, no per-call formatting)
+_ALBUM_CSS = """    body {
         font-family: Arial, sans-serif;
         max-width: 1200px;
         margin: 0 auto;
         padding: 20px;
         background-color: #f5f5f5;
-    }}
-    h1 {{
+    }
+    h1 {
         text-align: center;
         color: #333;
-    }}
-    .gallery {{
+    }
+    .gallery {
         display: grid;
         grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
         grid-gap: 15px;
         margin-top: 20px;
-    }}
-    .gallery img {{
+    }
+    .gallery img {
         width: 100%;
         height: auto;
         border-radius: 5px;
         box-shadow: 0 2px 5px rgba(0, 0, 0, 0.1);
         transition: transform 0.3s ease;
-    }}
-    .gallery img:hover {{
+    }
+    .gallery img:hover {
         transform: scale(1.03);
-    }}
-    .info {{
+    }
+    .info {
         text-align: center;
         margin-bottom: 20px;
         color: #666;
-    }}
-    .desc {{
+    }
+    .desc {
         margin-top: 15px;
         padding: 10px;
         background-color: #fff;
         border-radius: 5px;
         box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
-    }}
-</style>
-</head>
-<body>
-<h1>{album_name}</h1>
-<div class="info">
-    <p>Platform: {platform}</p>
-    <p>Author: {author}</p>
-    <p>Album contains {len(image_files)} images</p>
-</div>"""
+    }
+"""
 
-    # Add description if available
-    if description:
-        html_content += f'\n    <div class="desc">{description}</div>'
-
-    # Add gallery
-    html_content += '\n    <div class="gallery">'
-
-    # Add images to the gallery
-    for image_file in image_files:
-        html_content += f'\n        <img src="{image_file}" alt="{image_file}">'
-
-    html_content += '\n    </div>\n</body>\n</html>'
-
-    return html_content
-
-def fallback_mixed_template(context):
-    """Simple string-based template for mixed content index"""
-    content_name = context['content_name']
-    platform = context['platform']
-    author = context['author']
-    description = context.get('description', '')
-    videos = context.get('videos', [])
-    images = context.get('images', [])
-    audio = context.get('audio', [])
-    music = context.get('music', [])
-
-    html_content = f"""<!DOCTYPE html>
-<html>
-<head>
-<meta charset="UTF-8">
-<meta name="viewport" content="width=device-width, initial-scale=1.0">
-<title>{content_name}</title>
-<style>
-    body {{
+_MIXED_CSS = """    body {
         font-family: Arial, sans-serif;
         max-width: 1200px;
         margin: 0 auto;
         padding: 20px;
         background-color: #f5f5f5;
-    }}
-    h1, h2 {{
+    }
+    h1, h2 {
         color: #333;
-    }}
-    h1 {{
+    }
+    h1 {
         text-align: center;
-    }}
-    .info {{
+    }
+    .info {
         text-align: center;
         margin-bottom: 20px;
         color: #666;
-    }}
-    .section {{
+    }
+    .section {
         margin-top: 30px;
         padding: 15px;
         background-color: #fff;
         border-radius: 5px;
         box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
-    }}
-    .gallery {{
+    }
+    .gallery {
         display: grid;
         grid-template-columns: repeat(auto-fill, minmax(250px, 1fr));
         grid-gap: 15px;
         margin-top: 20px;
-    }}
-    .gallery img {{
+    }
+    .gallery img {
         width: 100%;
         height: auto;
         border-radius: 5px;
         box-shadow: 0 2px 5px rgba(0, 0, 0, 0.1);
-    }}
-    .media-item {{
+    }
+    .media-item {
         margin: 10px 0;
         padding: 10px;
         background-color: #f9f9f9;
         border-radius: 5px;
-    }}
-    .desc {{
+    }
+    .desc {
         margin-top: 15px;
         padding: 10px;
         background-color: #fff;
         border-radius: 5px;
         box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
-    }}
-    video, audio {{
+    }
+    video, audio {
         width: 100%;
         margin-top: 10px;
-    }}
-    a {{
+    }
+    a {
         color: #0066cc;
         text-decoration: none;
-    }}
-    a:hover {{
+    }
+    a:hover {
         text-decoration: underline;
-    }}
-</style>
+    }
+"""
+
+_ALBUM_TEMPLATE = _env.from_string("""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>{{ album_name }}</title>
+<style>
+""" + _ALBUM_CSS + """</style>
 </head>
 <body>
-<h1>{content_name}</h1>
+<h1>{{ album_name }}</h1>
 <div class="info">
-    <p>Platform: {platform}</p>
-    <p>Author: {author}</p>
-</div>"""
-
-    # Add description if available
-    if description:
-        html_content += f'\n    <div class="desc">{description}</div>'
+    <p>Platform: {{ platform }}</p>
+    <p>Author: {{ author }}</p>
+    <p>Album contains {{ image_files|length }} images</p>
+</div>
+{%- if description %}
+    <div class="desc">{{ description }}</div>
+{%- endif %}
+    <div class="gallery">
+{%- for image_file in image_files %}
+        <img src="{{ image_file }}" alt="{{ image_file }}">
+{%- endfor %}
+    </div>
+</body>
+</html>""")
 
-    # Add videos section
-    if videos:
-        html_content += f'\n    <div class="section">\n        <h2>Videos ({len(videos)})</h2>'
-        for video_file in videos:
-            html_content += f'''
+_MIXED_TEMPLATE = _env.from_string("""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>{{ content_name }}</title>
+<style>
+""" + _MIXED_CSS + """</style>
+</head>
+<body>
+<h1>{{ content_name }}</h1>
+<div class="info">
+    <p>Platform: {{ platform }}</p>
+    <p>Author: {{ author }}</p>
+</div>
+{%- if description %}
+    <div class="desc">{{ description }}</div>
+{%- endif %}
+{%- if videos %}
+    <div class="section">
+        <h2>Videos ({{ videos|length }})</h2>
+{%- for video_file in videos %}
     <div class="media-item">
-        <p>{video_file}</p>
+        <p>{{ video_file }}</p>
         <video controls>
-            <source src="{video_file}" type="video/mp4">
+            <source src="{{ video_file }}" type="video/mp4">
             Your browser does not support the video tag.
         </video>
-        <p><a href="{video_file}" download>Download Video</a></p>
-    </div>'''
-        html_content += '\n    </div>'
-
-    # Add images section
-    if images:
-        html_content += f'\n    <div class="section">\n        <h2>Images ({len(images)})</h2>\n        <div class="gallery">'
-        for image_file in images:
-            html_content += f'\n            <a href="{image_file}" target="_blank"><img src="{image_file}" alt="{image_file}"></a>'
-        html_content += '\n        </div>\n    </div>'
-
-    # Add audio section
-    if audio:
-        html_content += f'\n    <div class="section">\n        <h2>Audio ({len(audio)})</h2>'
-        for audio_file in audio:
-            html_content += f'''
+        <p><a href="{{ video_file }}" download>Download Video</a></p>
+    </div>
+{%- endfor %}
+    </div>
+{%- endif %}
+{%- if images %}
+    <div class="section">
+        <h2>Images ({{ images|length }})</h2>
+        <div class="gallery">
+{%- for image_file in images %}
+            <a href="{{ image_file }}" target="_blank"><img src="{{ image_file }}" alt="{{ image_file }}"></a>
+{%- endfor %}
+        </div>
+    </div>
+{%- endif %}
+{%- if audio %}
+    <div class="section">
+        <h2>Audio ({{ audio|length }})</h2>
+{%- for audio_file in audio %}
     <div class="media-item">
-        <p>{audio_file}</p>
+        <p>{{ audio_file }}</p>
         <audio controls>
-            <source src="{audio_file}" type="audio/mpeg">
+            <source src="{{ audio_file }}" type="audio/mpeg">
             Your browser does not support the audio tag.
         </audio>
-        <p><a href="{audio_file}" download>Download Audio</a></p>
-    </div>'''
-        html_content += '\n    </div>'
-
-    # Add music section
-    if music:
-        html_content += f'\n    <div class="section">\n        <h2>Music ({len(music)})</h2>'
-        for music_file in music:
-            html_content += f'''
+        <p><a href="{{ audio_file }}" download>Download Audio</a></p>
+    </div>
+{%- endfor %}
+    </div>
+{%- endif %}
+{%- if music %}
+    <div class="section">
+        <h2>Music ({{ music|length }})</h2>
+{%- for music_file in music %}
     <div class="media-item">
-        <p>{music_file}</p>
+        <p>{{ music_file }}</p>
         <audio controls>
-            <source src="{music_file}" type="audio/mpeg">
+            <source src="{{ music_file }}" type="audio/mpeg">
             Your browser does not support the audio tag.
         </audio>
-        <p><a href="{music_file}" download>Download Music</a></p>
-    </div>'''
-        html_content += '\n    </div>'
+        <p><a href="{{ music_file }}" download>Download Music</a></p>
+    </div>
+{%- endfor %}
+    </div>
+{%- endif %}
+</body>
+</html>""")
 
-    html_content += '\n</body>\n</html>'
 
-    return html_content
\ No newline at end of file
+def fallback_album_template(context):
+    """Simple standalone template for album preview"""
+    return _ALBUM_TEMPLATE.render(**context)
+
+def fallback_mixed_template(context):
+    """Simple standalone template for mixed content index"""
+    return _MIXED_TEMPLATE.render(**context)
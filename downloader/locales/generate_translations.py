@@ -1,5 +1,11 @@
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson  # optional, much faster than the stdlib json module
+except ImportError:
+    orjson = None
 
 # List of languages to be translated
 languages = {
@@ -23,20 +29,36 @@ languages = {
 with open("en.json", "r", encoding="utf-8") as f:
     en_data = json.load(f)
 
+# Serialize once; json.loads of these bytes is a cheaper deep copy than copy.deepcopy
+en_bytes = json.dumps(en_data, ensure_ascii=False).encode("utf-8")
+
 # Make sure the output directory exists
 output_dir = "translations"
 os.makedirs(output_dir, exist_ok=True)
 
-# Generate translations for each language
-for lang_code, lang_name in languages.items():
-    translated_data = en_data.copy()
+# Generate the translation file for one language
+def write_lang(item):
+    lang_code, lang_name = item
+
+    # Each worker needs its own copy, since language_info is mutated per language
+    translated_data = json.loads(en_bytes)
     translated_data["language_info"]["name"] = lang_name.split(" (")[0]
     translated_data["language_info"]["native_name"] = lang_name.split(" (")[0]
 
+    if orjson is not None:
+        data_bytes = orjson.dumps(translated_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        data_bytes = json.dumps(translated_data, indent=2, ensure_ascii=False).encode("utf-8")
+
     output_file = os.path.join(output_dir, f"{lang_code}.json")
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(translated_data, f, indent=2, ensure_ascii=False)
+    with open(output_file, "wb") as f:
+        f.write(data_bytes)
 
     print(f"✅ {output_file} created!")
 
+
+# The files are independent, so write them in parallel
+with ThreadPoolExecutor(max_workers=8) as executor:
+    list(executor.map(write_lang, languages.items()))
+
 print("🎉 All translation files have been generated successfully!")
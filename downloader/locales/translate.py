@@ -2,14 +2,91 @@
 Translation module for TikHub Downloader
 """
 
+import functools
 import json
 import os
 import logging
 import locale
+import pickle
 import sys
 import re
 from pathlib import Path
 
+try:
+    import orjson as _json_fast  # 可选依赖，解析速度远快于标准库json
+except ImportError:
+    _json_fast = None
+
+# 设置日志记录器
+logger = logging.getLogger(__name__)
+
+
+def _load_json_file(path):
+    """
+    Read and parse a UTF-8 JSON file, using orjson when it is installed
+
+    Args:
+        path (str): Path to the JSON file
+
+    Returns:
+        Parsed JSON data
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if _json_fast is not None:
+        return _json_fast.loads(raw)
+    return json.loads(raw)
+
+
+def _read_language_info(translation_file):
+    """
+    Read the language_info section of a language file
+
+    Args:
+        translation_file (str): Path to the language JSON file
+
+    Returns:
+        dict: The language_info section, or an empty dict if unavailable
+    """
+    try:
+        lang_data = _load_json_file(translation_file)
+        lang_info = lang_data.get('language_info')
+        return lang_info if isinstance(lang_info, dict) else {}
+    except Exception as e:
+        # 如果提取失败，调用方会使用语言代码作为名称
+        logger.warning("Failed to extract language name from %s: %s", translation_file, e)
+        return {}
+
+
+@functools.lru_cache(maxsize=4)
+def _scan_locales(locale_dir, dir_mtime):
+    """
+    Scan a locales directory once per process (per directory modification time)
+
+    Args:
+        locale_dir (str): Path to the locales directory
+        dir_mtime (int): Directory st_mtime_ns, part of the cache key so that
+            adding or removing language files invalidates the cached result
+
+    Returns:
+        tuple: (language codes, {code: language_info} for codes not in the base map)
+    """
+    # 单次扫描所有JSON文件：从文件名提取语言代码，并读取基本映射中没有的语言信息
+    available_languages = []
+    lang_info_cache = {}
+    with os.scandir(locale_dir) as entries:
+        for entry in entries:
+            if not (entry.is_file() and entry.name.endswith('.json')):
+                continue
+
+            lang_code = entry.name[:-len('.json')]
+            available_languages.append(lang_code)
+
+            if lang_code not in Translator.BASE_LANGUAGE_MAP:
+                lang_info_cache[lang_code] = _read_language_info(entry.path)
+
+    return tuple(available_languages), lang_info_cache
+
 
 class Translator:
     """
@@ -46,12 +123,22 @@ class Translator:
         """
         self.language = language
         self.translations = {}
+        self._flat = {}  # Will store "module.key" -> translation, built at load time
         self.available_languages = []
         self.language_map = {}  # Will store code -> display name mapping
         self.reverse_language_map = {}  # Will store display name -> code mapping
+        self._lower_name_map = {}  # Will store lowercased display name -> code mapping
+        self._name_trie = {}  # Will store a character trie of lowercased display names
+        self._lang_info_cache = {}  # Will store code -> language_info read from language files
+        self._language_names = []  # Will store display names in available_languages order
+        self._name_to_index = {}  # Will store display name -> dropdown index mapping
+        self._code_to_index = {}  # Will store code -> dropdown index mapping
+
+        # 每个实例独立的查找缓存，加载新语言时清空
+        self._lookup = functools.lru_cache(maxsize=4096)(self._lookup_template)
 
-        # 设置日志级别，便于调试
-        logging.basicConfig(level=logging.INFO)
+        # Resolve the locales directory once; it cannot change while the app runs
+        self._locale_dir = self._get_resource_path('locales')
 
         # Load languages and build the mappings
         self._load_languages()
@@ -61,8 +148,8 @@ class Translator:
         self.load_language(language)
 
         # 记录初始语言信息，便于调试
-        logging.info(f"Translator initialized with language: {language}")
-        logging.info(f"Available languages: {self.available_languages}")
+        logger.debug("Translator initialized with language: %s", language)
+        logger.debug("Available languages: %s", self.available_languages)
 
     def _get_resource_path(self, relative_path):
         """
@@ -79,7 +166,6 @@ class Translator:
             if getattr(sys, '_MEIPASS', None):
                 # PyInstaller打包后的临时目录
                 base_path = sys._MEIPASS
-                logging.info(f"Running in PyInstaller environment: {base_path}")
             else:
                 # 开发环境
                 # 如果是从downloader目录下的locales目录加载，需要向上一级
@@ -90,14 +176,12 @@ class Translator:
                 else:
                     # 当前文件直接在项目根目录下
                     base_path = script_dir
-                logging.info(f"Running in development environment: {base_path}")
 
             # 构建完整路径
             full_path = os.path.join(base_path, relative_path)
-            logging.info(f"Resource path resolved to: {full_path}")
             return full_path
         except Exception as e:
-            logging.error(f"Error getting resource path: {str(e)}")
+            logger.error("Error getting resource path: %s", e)
             # 在出错时尝试使用相对路径
             return relative_path
 
@@ -107,80 +191,67 @@ class Translator:
         """
         try:
             # 获取语言文件目录
-            locale_dir = self._get_resource_path('locales')
-            logging.info(f"Looking for language files in: {locale_dir}")
+            locale_dir = self._locale_dir
+            logger.debug("Looking for language files in: %s", locale_dir)
 
             # 确保目录存在
             if not os.path.exists(locale_dir):
-                logging.warning(f"Locales directory does not exist: {locale_dir}")
+                logger.warning("Locales directory does not exist: %s", locale_dir)
                 self.available_languages = ['en']  # 回退到英语
                 return
 
-            # 列出所有JSON文件
-            if os.path.isdir(locale_dir):
-                language_files = [os.path.join(locale_dir, f) for f in os.listdir(locale_dir)
-                                 if f.endswith('.json')]
-            else:
-                language_files = []
-
-            # 从文件名提取语言代码
-            self.available_languages = [os.path.splitext(os.path.basename(file))[0]
-                                       for file in language_files]
+            # 扫描结果在进程内按目录修改时间缓存，多个Translator实例共享
+            dir_mtime = os.stat(locale_dir).st_mtime_ns
+            languages, self._lang_info_cache = _scan_locales(locale_dir, dir_mtime)
+            self.available_languages = list(languages)
 
             if not self.available_languages:
-                logging.warning(f"No language files found in {locale_dir}")
+                logger.warning("No language files found in %s", locale_dir)
                 self.available_languages = ['en']  # 回退到英语
 
             # 记录发现的语言
-            logging.info(f"Discovered language files: {', '.join(self.available_languages)}")
+            logger.debug("Discovered language files: %s", self.available_languages)
 
         except Exception as e:
-            logging.error(f"Error loading languages: {str(e)}")
+            logger.error("Error loading languages: %s", e)
             self.available_languages = ['en']  # 回退到英语
 
     def _build_language_maps(self):
         """
         Build mappings between language codes and display names
-        Try to extract language name from each language file
+        Uses the language_info collected by _load_languages
         """
         # 初始化基本映射
         self.language_map = self.BASE_LANGUAGE_MAP.copy()
 
-        # 获取locales目录
-        locale_dir = self._get_resource_path('locales')
-
-        # 对每种可用语言，尝试从文件中获取显示名称
+        # 对每种可用语言，使用扫描时读取的语言信息获取显示名称
         for lang_code in self.available_languages:
-            try:
-                # 如果基本映射中已有显示名称，则使用它
-                if lang_code in self.language_map:
-                    continue
-
-                # 否则，尝试加载语言文件提取语言名称
-                translation_file = os.path.join(locale_dir, f"{lang_code}.json")
-
-                with open(translation_file, 'r', encoding='utf-8') as f:
-                    lang_data = json.load(f)
-
-                # 尝试从文件中获取语言名称
-                if 'language_info' in lang_data and 'name' in lang_data['language_info']:
-                    display_name = lang_data['language_info']['name']
-                    native_name = lang_data['language_info'].get('native_name', display_name)
-
-                    # 格式化为"本地名称 (英文名称)"，如果它们不同
-                    if native_name != display_name:
-                        self.language_map[lang_code] = f"{native_name} ({display_name})"
-                    else:
-                        self.language_map[lang_code] = display_name
+            # 如果基本映射中已有显示名称，则使用它
+            if lang_code in self.language_map:
+                continue
+
+            # 尝试从文件中获取语言名称
+            lang_info = self._lang_info_cache.get(lang_code, {})
+            if 'name' in lang_info:
+                display_name = lang_info['name']
+                native_name = lang_info.get('native_name', display_name)
+
+                # 格式化为"本地名称 (英文名称)"，如果它们不同
+                if native_name != display_name:
+                    self.language_map[lang_code] = f"{native_name} ({display_name})"
                 else:
-                    # 如果找不到语言信息，则使用语言代码
-                    self.language_map[lang_code] = lang_code.upper()
-
-            except Exception as e:
-                # 如果提取失败，使用语言代码作为名称
-                logging.warning(f"Failed to extract language name for {lang_code}: {str(e)}")
+                    self.language_map[lang_code] = display_name
+            else:
+                # 如果找不到语言信息，则使用语言代码
                 self.language_map[lang_code] = lang_code.upper()
 
+        # UI下拉框使用的显示名称列表，与 available_languages 顺序一致
+        self._language_names = [self.language_map.get(lang, lang) for lang in self.available_languages]
+        self._code_to_index = {code: i for i, code in enumerate(self.available_languages)}
+        self._name_to_index = {}
+        for i, name in enumerate(self._language_names):
+            self._name_to_index.setdefault(name, i)  # 与 list.index 一致，重名时取第一个
+
         # 构建反向映射(显示名称 -> 代码)
         self.reverse_language_map = {name: code for code, name in self.language_map.items()}
 
@@ -188,9 +259,21 @@ class Translator:
         for code in self.available_languages:
             self.reverse_language_map[code] = code
 
+        # 不区分大小写的反向映射，用于名称不完全一致时的查找
+        self._lower_name_map = {name.lower(): code for name, code in self.reverse_language_map.items()}
+
+        # 显示名称的字符前缀树（字典嵌套字典，None键保存语言代码），用于部分匹配
+        trie = {}
+        for code, name in self.language_map.items():
+            node = trie
+            for char in name.lower():
+                node = node.setdefault(char, {})
+            node[None] = code
+        self._name_trie = trie
+
         # 记录语言映射
-        logging.info(f"Language mappings: {self.language_map}")
-        logging.info(f"Reverse language mappings: {self.reverse_language_map}")
+        logger.debug("Language mappings: %s", self.language_map)
+        logger.debug("Reverse language mappings: %s", self.reverse_language_map)
 
     @staticmethod
     def detect_system_language():
@@ -203,7 +286,7 @@ class Translator:
         try:
             # Get system locale
             system_locale, _ = locale.getdefaultlocale()
-            logging.info(f"Detected system locale: {system_locale}")
+            logger.debug("Detected system locale: %s", system_locale)
 
             # Default to English
             default_language = 'en'
@@ -211,19 +294,19 @@ class Translator:
             if system_locale:
                 # Extract language code (first part before '_')
                 lang_code = system_locale.split('_')[0].lower()
-                logging.info(f"Extracted language code: {lang_code}")
+                logger.debug("Extracted language code: %s", lang_code)
 
                 # Return the language code if it matches any known language
                 if lang_code in Translator.BASE_LANGUAGE_MAP:
-                    logging.info(f"Using detected language: {lang_code}")
+                    logger.debug("Using detected language: %s", lang_code)
                     return lang_code
                 else:
-                    logging.info(f"Language code {lang_code} not supported, using default: {default_language}")
+                    logger.debug("Language code %s not supported, using default: %s", lang_code, default_language)
 
             return default_language
 
         except Exception as e:
-            logging.error(f"Error detecting system language: {str(e)}")
+            logger.error("Error detecting system language: %s", e)
             return 'en'  # Fallback to English
 
     def load_language(self, language):
@@ -234,37 +317,99 @@ class Translator:
             language (str): Language code
         """
         # 记录加载的语言，便于调试
-        logging.info(f"Attempting to load language: {language}")
+        logger.debug("Attempting to load language: %s", language)
 
         if language not in self.available_languages:
-            logging.warning(f"Language '{language}' not available, falling back to English")
+            logger.warning("Language '%s' not available, falling back to English", language)
             language = 'en'
 
         try:
             # 获取翻译文件路径
-            locale_dir = self._get_resource_path('locales')
+            locale_dir = self._locale_dir
             translation_file = os.path.join(locale_dir, f"{language}.json")
 
-            # 记录文件路径和是否存在
-            logging.info(f"Loading language file: {translation_file}")
-            logging.info(f"File exists: {os.path.exists(translation_file)}")
-
-            # 列出目录中的所有文件（调试用）
-            if os.path.isdir(os.path.dirname(translation_file)):
-                logging.info(f"Files in directory: {os.listdir(os.path.dirname(translation_file))}")
+            # 记录文件路径、是否存在以及目录中的所有文件（调试用，仅在DEBUG级别时执行）
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Loading language file: %s", translation_file)
+                logger.debug("File exists: %s", os.path.exists(translation_file))
+                if os.path.isdir(locale_dir):
+                    logger.debug("Files in directory: %s", os.listdir(locale_dir))
 
             # 加载翻译
-            with open(translation_file, 'r', encoding='utf-8') as f:
-                self.translations = json.load(f)
+            self.translations = self._read_translation_file(translation_file)
+
+            # 展平为"模块.键"字典，查找时只需一次哈希
+            flat = {}
+            for module, entries in self.translations.items():
+                if isinstance(entries, dict):
+                    flat.update((f"{module}.{key}", value) for key, value in entries.items())
+            self._flat = flat
+            self._lookup.cache_clear()
 
             self.language = language
-            logging.info(f"Successfully loaded language: {language}")
+            logger.debug("Successfully loaded language: %s", language)
         except Exception as e:
-            logging.error(f"Error loading language '{language}': {str(e)}")
+            logger.error("Error loading language '%s': %s", language, e)
             # 如果加载失败，尝试加载英语
             if language != 'en':
                 self.load_language('en')
 
+    def _read_translation_file(self, translation_file):
+        """
+        Parse a translation file, using a pickle sidecar cache when it is up to date
+        (source checkouts only; frozen builds always parse the JSON)
+
+        Args:
+            translation_file (str): Path to the language JSON file
+
+        Returns:
+            dict: Parsed translations
+        """
+        # 打包后的程序（PyInstaller）每次运行都解压到新的临时目录，缓存不会命中，直接解析JSON
+        if getattr(sys, 'frozen', False):
+            return _load_json_file(translation_file)
+
+        # 缓存以JSON文件的修改时间和大小作为签名，JSON变化后自动失效
+        stat = os.stat(translation_file)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cache_file = f"{translation_file}.pkl"
+
+        try:
+            with open(cache_file, 'rb') as f:
+                cached_signature, translations = pickle.load(f)
+            if cached_signature == signature:
+                return translations
+        except Exception:
+            pass  # 缓存不存在、已过期或已损坏，重新解析JSON
+
+        translations = _load_json_file(translation_file)
+
+        try:
+            with open(cache_file, 'wb') as f:
+                pickle.dump((signature, translations), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            # 目录不可写时（如只读安装）仅跳过缓存
+            logger.debug("Could not write translation cache %s: %s", cache_file, e)
+
+        return translations
+
+    def _lookup_template(self, module, key):
+        """
+        Look up the raw (unformatted) translation template for a key
+
+        Args:
+            module (str): Module name
+            key (str): Translation key
+
+        Returns:
+            str: Translation template or key if translation not found
+        """
+        # 命中是常态，直接索引比带默认值的get更快
+        try:
+            return self._flat[f"{module}.{key}"]
+        except KeyError:
+            return key
+
     def translate(self, module, key, **kwargs):
         """
         Translate a key from the specified module
@@ -278,11 +423,8 @@ class Translator:
             str: Translated string or key if translation not found
         """
         try:
-            # Get the module translations
-            module_translations = self.translations.get(module, {})
-
-            # Get the translation for the key
-            translation = module_translations.get(key, key)
+            # Get the cached template for the key
+            translation = self._lookup(module, key)
 
             # Apply format arguments if any
             if kwargs:
@@ -290,7 +432,7 @@ class Translator:
 
             return translation
         except Exception as e:
-            logging.error(f"Translation error for {module}.{key}: {str(e)}")
+            logger.error("Translation error for %s.%s: %s", module, key, e)
             return key
 
     def get_available_languages(self):
@@ -309,8 +451,27 @@ class Translator:
         Returns:
             list: List of language names
         """
-        # Return the display names for all available languages
-        return [self.language_map.get(lang, lang) for lang in self.available_languages]
+        # Return the display names for all available languages (built with the language maps)
+        return self._language_names
+
+    def get_language_index(self, code, name=None):
+        """
+        Get the position of a language in get_language_names()
+
+        Args:
+            code (str): Language code
+            name (str): Display name to try first (default: the mapped name of code)
+
+        Returns:
+            int: Index in the language name list, or 0 if the language is unknown
+        """
+        if name is None:
+            name = self.language_map.get(code, code)
+
+        index = self._name_to_index.get(name)
+        if index is None:
+            index = self._code_to_index.get(code, 0)
+        return index
 
     def get_language_code_from_name(self, name):
         """
@@ -322,38 +483,53 @@ class Translator:
         Returns:
             str: Language code
         """
-        # 添加调试信息
-        logging.info(f"Attempting to get language code for name: '{name}'")
-        logging.info(f"Available reverse mappings: {self.reverse_language_map}")
-
-        # 尝试直接从反向映射获取
+        # 尝试直接从反向映射获取（包含显示名称和语言代码本身）
         code = self.reverse_language_map.get(name)
         if code:
-            logging.info(f"Found language code '{code}' for name '{name}'")
+            logger.debug("Found language code '%s' for name '%s'", code, name)
             return code
 
-        # 如果未找到，尝试查找最匹配的语言名称
-        # 这增加了系统的健壮性，即使UI显示的名称与映射中的不完全匹配
-        for display_name, lang_code in self.reverse_language_map.items():
-            if name in display_name or display_name in name:
-                logging.info(f"Found partial match: '{lang_code}' for '{name}'")
-                return lang_code
+        # 如果未找到，忽略大小写再查找一次
+        code = self._lower_name_map.get(name.lower())
+        if code:
+            logger.debug("Found case-insensitive match: '%s' for '%s'", code, name)
+            return code
 
-        # 如果是语言代码本身，直接返回
-        if name in self.available_languages:
-            logging.info(f"Name '{name}' is a language code itself")
-            return name
+        # 再尝试最长前缀匹配，例如 "English (US)" 匹配 "English"
+        code = self._longest_name_prefix(name.lower())
+        if code:
+            logger.debug("Found prefix match: '%s' for '%s'", code, name)
+            return code
 
         # 默认返回英语
-        logging.warning(f"Could not find language code for '{name}', defaulting to 'en'")
+        logger.warning("Could not find language code for '%s', defaulting to 'en'", name)
         return 'en'
 
+    def _longest_name_prefix(self, name):
+        """
+        Find the language whose display name is the longest prefix of a name
+
+        Args:
+            name (str): Lowercased name to match
+
+        Returns:
+            str: Language code, or None if no display name is a prefix of the name
+        """
+        node = self._name_trie
+        code = None
+        for char in name:
+            node = node.get(char)
+            if node is None:
+                break
+            code = node.get(None, code)
+        return code
+
     def reload_languages(self):
         """
         Reload all language information and mappings
         Useful after new language files are added at runtime
         """
-        logging.info(f"Reloading languages (current: {self.language})")
+        logger.debug("Reloading languages (current: %s)", self.language)
         current_language = self.language
         self._load_languages()
         self._build_language_maps()
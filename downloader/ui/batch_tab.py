@@ -2,12 +2,14 @@
 Enhanced batch download tab for TikHub Downloader with modern UI, improved UX and multithreaded downloads
 """
 
+import io
+import os
 import threading
 import tkinter as tk
 from tkinter import messagebox, filedialog
-import queue
 import time
-from concurrent.futures import ThreadPoolExecutor
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import ttkbootstrap as ttk
 try:
     from ttkbootstrap.constants import *
@@ -18,12 +20,113 @@ except ImportError:
     # Fallback if extended components are not available
     HAS_TTKBOOTSTRAP_EXTENSIONS = False
 import re
+from functools import lru_cache
 
+from downloader.constants import MAX_CONCURRENT_HTTP_DOWNLOADS
 from downloader.core.downloader import VideoDownloader
-from downloader.utils.utils import extract_urls_from_text, open_folder
+from downloader.utils.utils import extract_urls_from_text, normalize_share_url, open_folder
 from downloader.utils.logger import logger_instance
 
 
+@lru_cache(maxsize=64)
+def _extract_urls_cached(content):
+    """Extract URLs from text, reusing earlier results for text seen recently
+
+    Scrolling back and forth re-scans the same visible lines, so those hit the cache.
+
+    Args:
+        content: Text to scan
+
+    Returns:
+        tuple: URLs found by extract_urls_from_text
+    """
+    return tuple(extract_urls_from_text(content))
+
+
+class _AdaptiveConcurrency:
+    """Limit in-flight downloads to a target that follows measured throughput
+
+    The thread pool size chosen in the UI is the ceiling. Every couple of seconds the
+    per-worker completion rate is compared with its moving average: the target climbs
+    by one while the rate holds, and backs off when it drops noticeably (server
+    throttling, saturated link or disk).
+    """
+
+    def __init__(self, max_limit, min_limit=1, interval=2.0, alpha=0.3, backoff=0.15):
+        """Initialize the limiter
+
+        Args:
+            max_limit: Upper bound for concurrent downloads (the pool size)
+            min_limit: Lower bound for concurrent downloads
+            interval: Seconds between target adjustments
+            alpha: Smoothing factor of the throughput moving average
+            backoff: Relative drop in per-worker throughput that triggers a back-off
+        """
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.limit = max(self.min_limit, self.max_limit // 2)
+        self.interval = interval
+        self.alpha = alpha
+        self.backoff = backoff
+
+        self._cond = threading.Condition()
+        self._inflight = 0
+        self._closed = False
+        self._completed = 0
+        self._window_start = time.monotonic()
+        self._throughput_ewma = None
+
+    def acquire(self):
+        """Wait for a free slot
+
+        Returns:
+            bool: False if the limiter was closed while waiting
+        """
+        with self._cond:
+            while self._inflight >= self.limit and not self._closed:
+                self._cond.wait()
+            if self._closed:
+                return False
+            self._inflight += 1
+            return True
+
+    def release(self):
+        """Free a slot after a download finished"""
+        with self._cond:
+            self._inflight -= 1
+            self._completed += 1
+            self._adjust()
+            # The target may have grown, so wake every waiting worker
+            self._cond.notify_all()
+
+    def close(self):
+        """Release all waiting workers without granting them a slot"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def _adjust(self):
+        """Move the target by one step based on the last window (lock held)"""
+        now = time.monotonic()
+        elapsed = now - self._window_start
+        if elapsed < self.interval:
+            return
+
+        per_worker = self._completed / elapsed / self.limit
+        self._completed = 0
+        self._window_start = now
+
+        if self._throughput_ewma is not None and per_worker < self._throughput_ewma * (1 - self.backoff):
+            self.limit = max(self.min_limit, self.limit - 1)
+        else:
+            self.limit = min(self.max_limit, self.limit + 1)
+
+        if self._throughput_ewma is None:
+            self._throughput_ewma = per_worker
+        else:
+            self._throughput_ewma = self.alpha * per_worker + (1 - self.alpha) * self._throughput_ewma
+
+
 class BatchTab:
     """Batch download tab UI and functionality with multithreaded download support"""
 
@@ -43,19 +146,73 @@ class BatchTab:
         self.download_thread = None
         self.stop_download = False
         self.paused = False
-
-        # Thread coordination
-        self.result_queue = queue.Queue()
-        self.lock = threading.Lock()
+        # Cleared while paused; workers block on it instead of polling self.paused
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+        self._concurrency = None  # _AdaptiveConcurrency of the running batch
+        self._executor = None  # ThreadPoolExecutor of the running batch
+
+        # Thread coordination: workers append results, only the Tk thread pops them
+        # (deque append/popleft are atomic, so no lock is needed on this path)
+        self.result_queue = deque()
+        # (url, status) changes for the "currently downloading" rows; a None status removes the row
+        self._row_updates = deque()
+        # Pending after() id of the next coalesced drain of the two queues above, and
+        # whether a worker has already posted <<DownloadProgress>> for it
+        self._drain_after = None
+        self._drain_scheduled = False
+        # Set by the batch thread once every result has been queued
+        self._batch_finished = threading.Event()
+
+        # (widget, translation key, text prefix) of every widget update_language retranslates
+        self._i18n = []
 
         # Download statistics
         self.completed = 0
         self.failed = 0
         self.successful_urls = []
         self.failed_urls = []
-        self.download_times = []
+        # Running total and count of successful download times, for an O(1) average
+        self._times_sum = 0.0
+        self._times_count = 0
         self.start_time = None
-        self.currently_downloading = set()
+
+        # Last ETA shown, in whole seconds, and its formatted text
+        self._eta_seconds = None
+        self._eta_text = "--:--:--"
+
+        # Last values pushed to the progress bar, to skip redundant reconfiguration
+        self._progress_value = None
+        self._progress_color = None
+
+        # Every URL downloaded successfully in this session (successful_urls only covers the last batch)
+        self._successful_set = set()
+        # Row state of each URL currently downloading:
+        # {"item_id": Treeview item, "start": start time, "display_url": truncated URL shown}
+        self._download_items = {}
+
+        # URL highlighting search pattern and the URL set it was built from
+        self._url_pattern_key = None
+        self._url_pattern = None
+
+        # Pending debounced highlight (after() id)
+        self._highlight_after = None
+
+        # Set while _extract_worker runs
+        self._extracting = False
+
+        # Bumped on every edit of the batch text, so async work can tell whether its input is stale
+        self._text_generation = 0
+
+        # Per-line text and URLs of the batch input, so an edit only rescans the changed line
+        self._line_texts = []
+        self._line_urls = []
+        self._url_counts = Counter()
+        self._urls_dirty = True
+
+        # Set by a keystroke that can only change the line under the cursor (typing,
+        # BackSpace/Delete with no selection); anything else takes the full rescan
+        self._single_line_edit = False
 
         # Set the logger
         self.logger = logger_instance
@@ -135,6 +292,7 @@ class BatchTab:
             font=("", 11, "bold")
         )
         title_label.pack(side=tk.LEFT)
+        self._translatable(title_label, "batch_links")
 
         self.url_count_var = tk.StringVar(value="0 URLs")
         url_count_label = ttk.Label(header_frame, textvariable=self.url_count_var)
@@ -153,8 +311,32 @@ class BatchTab:
         )
         self.batch_text.pack(fill=tk.BOTH, expand=True, padx=1, pady=1)
 
-        # Bind URL validation and highlighting
-        self.batch_text.bind("<KeyRelease>", self._highlight_urls)
+        # URL highlight tags are configured once here, not on every highlight pass
+        self.batch_text.tag_configure("valid_url", foreground="green")
+        self.batch_text.tag_configure("invalid_url", foreground="red")
+
+        # Receives match lengths from Text.search when tagging URLs
+        self._search_count = tk.IntVar()
+
+        # Keyboard, mouse and resize events go to the inner Text widget, not the ScrolledText frame
+        self._text_widget = getattr(self.batch_text, 'text', self.batch_text)
+
+        # Bind URL validation and highlighting: edits are tracked through <<Modified>>;
+        # highlighting only covers the visible lines, so it is also refreshed (debounced)
+        # whenever the view scrolls or resizes
+        self._text_widget.bind("<<Modified>>", self._on_text_modified)
+        self._text_widget.bind("<Key>", self._on_text_key, add="+")
+        for view_event in ("<Configure>", "<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self._text_widget.bind(view_event, self._schedule_highlight, add="+")
+
+        # Dragging the scrollbar produces no events on the Text widget, so also hook the
+        # yscrollcommand that Tk calls on every view change
+        scroll_command = str(self._text_widget.cget("yscrollcommand"))
+        if scroll_command:
+            def on_yscroll(first, last):
+                self._text_widget.tk.eval(f"{scroll_command} {first} {last}")
+                self._schedule_highlight()
+            self._text_widget.configure(yscrollcommand=on_yscroll)
 
         # Control buttons frame with icon buttons
         control_frame = ttk.Frame(left_frame)
@@ -166,16 +348,17 @@ class BatchTab:
 
         # Buttons with icons and tooltips
         buttons_config = [
-            (self.translator.translate("batch_tab", "paste_button"), self._paste_to_batch, "paste",
+            ("paste_button", self._paste_to_batch, "paste",
              self.translator.translate("batch_tab", "paste_tooltip")),
-            (self.translator.translate("batch_tab", "clear_button"),
+            ("clear_button",
              lambda: [self.batch_text.delete(1.0, tk.END), self._count_urls()], "clear",
              self.translator.translate("batch_tab", "clear_tooltip")),
-            (self.translator.translate("batch_tab", "extract_urls_button"), self._extract_urls, "extract",
+            ("extract_urls_button", self._extract_urls, "extract",
              self.translator.translate("batch_tab", "extract_tooltip"))
         ]
 
-        for text, command, icon, tooltip in buttons_config:
+        for text_key, command, icon, tooltip in buttons_config:
+            text = self.translator.translate("batch_tab", text_key)
             btn = ttk.Button(
                 btn_group,
                 text=f" {text}",
@@ -186,6 +369,9 @@ class BatchTab:
             )
             if not isinstance(self.icons[icon], tk.PhotoImage):
                 btn.config(text=f"{self.icons[icon]} {text}")
+                self._translatable(btn, text_key, f"{self.icons[icon]} ")
+            else:
+                self._translatable(btn, text_key, " ")
 
             btn.pack(side=tk.LEFT, padx=2)
             self._create_tooltip(btn, tooltip)
@@ -198,6 +384,7 @@ class BatchTab:
             bootstyle=(OUTLINE, INFO)
         )
         file_btn.pack(side=tk.RIGHT)
+        self._translatable(file_btn, "extract_from_file")
         self._create_tooltip(
             file_btn,
             self.translator.translate("batch_tab", "extract_from_file_tooltip")
@@ -210,6 +397,7 @@ class BatchTab:
             bootstyle=SECONDARY
         )
         settings_panel.pack(fill=tk.X, pady=(10, 5))
+        self._translatable(settings_panel, "download_settings")
 
         # Settings grid
         settings_grid = ttk.Frame(settings_panel)
@@ -227,6 +415,7 @@ class BatchTab:
             command=self._toggle_custom_save
         )
         custom_save_check.pack(side=tk.LEFT)
+        self._translatable(custom_save_check, "custom_save_location")
 
         self.location_display = ttk.Label(
             save_location_frame,
@@ -246,13 +435,15 @@ class BatchTab:
             text=self.translator.translate("batch_tab", "concurrent_downloads")
         )
         thread_label.pack(side=tk.LEFT)
+        self._translatable(thread_label, "concurrent_downloads")
 
         self.thread_count_var = tk.IntVar(value=self.max_workers)
 
+        # Values above the HTTP download cap would only add idle worker threads
         thread_slider = ttk.Scale(
             thread_frame,
             from_=1,
-            to=20,
+            to=MAX_CONCURRENT_HTTP_DOWNLOADS,
             variable=self.thread_count_var,
             command=lambda val: self.thread_count_display.config(text=f"{int(float(val))}")
         )
@@ -273,6 +464,7 @@ class BatchTab:
             bootstyle=SUCCESS
         )
         self.download_button.pack(side=tk.LEFT, padx=(0, 5))
+        self._translatable(self.download_button, "start_batch_download")
 
         # Control buttons
         control_btns_frame = ttk.Frame(action_frame)
@@ -297,6 +489,7 @@ class BatchTab:
             bootstyle=DANGER
         )
         self.stop_button.pack(side=tk.LEFT, padx=2)
+        self._translatable(self.stop_button, "stop_download")
 
         # ----- RIGHT SIDE -----
 
@@ -308,6 +501,7 @@ class BatchTab:
             bootstyle=PRIMARY
         )
         progress_panel.pack(fill=tk.X, pady=(0, 10))
+        self._translatable(progress_panel, "download_progress")
 
         # Progress info
         progress_info_frame = ttk.Frame(progress_panel)
@@ -363,7 +557,9 @@ class BatchTab:
         elapsed_frame = ttk.Frame(time_stats)
         elapsed_frame.pack(fill=tk.X, pady=2)
 
-        ttk.Label(elapsed_frame, text=self.translator.translate("batch_tab", "elapsed_time")).pack(side=tk.LEFT)
+        self._translatable(
+            ttk.Label(elapsed_frame, text=self.translator.translate("batch_tab", "elapsed_time")), "elapsed_time"
+        ).pack(side=tk.LEFT)
         self.elapsed_var = tk.StringVar(value="00:00:00")
         ttk.Label(elapsed_frame, textvariable=self.elapsed_var).pack(side=tk.RIGHT)
 
@@ -371,7 +567,9 @@ class BatchTab:
         eta_frame = ttk.Frame(time_stats)
         eta_frame.pack(fill=tk.X, pady=2)
 
-        ttk.Label(eta_frame, text=self.translator.translate("batch_tab", "estimated_time")).pack(side=tk.LEFT)
+        self._translatable(
+            ttk.Label(eta_frame, text=self.translator.translate("batch_tab", "estimated_time")), "estimated_time"
+        ).pack(side=tk.LEFT)
         self.eta_var = tk.StringVar(value="--:--:--")
         ttk.Label(eta_frame, textvariable=self.eta_var).pack(side=tk.RIGHT)
 
@@ -383,11 +581,11 @@ class BatchTab:
         success_frame = ttk.Frame(count_stats)
         success_frame.pack(fill=tk.X, pady=2)
 
-        ttk.Label(
+        self._translatable(ttk.Label(
             success_frame,
             text=self.translator.translate("batch_tab", "successful"),
             foreground="green"
-        ).pack(side=tk.LEFT)
+        ), "successful").pack(side=tk.LEFT)
         self.success_var = tk.StringVar(value="0")
         ttk.Label(
             success_frame,
@@ -399,11 +597,11 @@ class BatchTab:
         failed_frame = ttk.Frame(count_stats)
         failed_frame.pack(fill=tk.X, pady=2)
 
-        ttk.Label(
+        self._translatable(ttk.Label(
             failed_frame,
             text=self.translator.translate("batch_tab", "failed"),
             foreground="red"
-        ).pack(side=tk.LEFT)
+        ), "failed").pack(side=tk.LEFT)
         self.failed_var = tk.StringVar(value="0")
         ttk.Label(
             failed_frame,
@@ -418,6 +616,7 @@ class BatchTab:
             padding=10
         )
         current_panel.pack(fill=tk.BOTH, expand=True)
+        self._translatable(current_panel, "currently_downloading")
 
         # Live download list using Treeview for better visualization
         self.current_downloads = ttk.Treeview(
@@ -449,6 +648,7 @@ class BatchTab:
             padding=10
         )
         results_frame.pack(fill=tk.BOTH, expand=True, pady=(10, 0))
+        self._translatable(results_frame, "download_results")
 
         # Notebook with tabs for successful and failed downloads
         results_notebook = ttk.Notebook(results_frame)
@@ -498,6 +698,7 @@ class BatchTab:
             command=lambda: open_folder(self.app.download_path)
         )
         open_folder_btn.pack(side=tk.LEFT)
+        self._translatable(open_folder_btn, "open_download_folder")
 
         export_btn = ttk.Button(
             toolbar,
@@ -505,29 +706,38 @@ class BatchTab:
             command=self._export_results
         )
         export_btn.pack(side=tk.RIGHT)
+        self._translatable(export_btn, "export_results")
 
-        # Start update timers
+        # Results are processed when workers signal them; the timer only drives the clock
+        self.frame.bind("<<DownloadProgress>>", self._on_download_progress)
         self._start_progress_update_timer()
-        self._start_url_highlight_timer()
 
     def _start_progress_update_timer(self):
-        """Start a timer to update progress UI periodically"""
+        """Start a 1 Hz timer to update the elapsed time display"""
         def update_timer():
             if self.is_downloading:
-                self._process_results_queue()
                 self._update_elapsed_time()
-            self.frame.after(100, update_timer)
+            self.frame.after(1000, update_timer)
 
-        self.frame.after(100, update_timer)
+        self.frame.after(1000, update_timer)
 
-    def _start_url_highlight_timer(self):
-        """Start a timer to periodically highlight URLs"""
-        def highlight_timer():
-            if not self.is_downloading:
-                self._highlight_urls(None)
-            self.frame.after(2000, highlight_timer)
+    def _post_result(self, result):
+        """Queue a download result and wake the Tk thread to process it
 
-        self.frame.after(2000, highlight_timer)
+        Args:
+            result: (success, url, download_time, error_message) tuple
+        """
+        self.result_queue.append(result)
+        self._schedule_drain()
+
+    def _schedule_drain(self):
+        """Wake the Tk thread to drain the queues, unless a wake-up is already pending"""
+        # Only the first change after a drain posts an event; later ones ride along with it.
+        # The flag is cleared before draining, so nothing appended afterwards is missed.
+        if self._drain_scheduled:
+            return
+        self._drain_scheduled = True
+        self.frame.event_generate("<<DownloadProgress>>", when="tail")
 
     def _create_tooltip(self, widget, text):
         """Create a tooltip for a widget using safer implementation"""
@@ -542,65 +752,169 @@ class BatchTab:
         """Hide tooltip when mouse leaves widget (disabled)"""
         pass
 
+    def _schedule_highlight(self, event=None):
+        """Debounce URL highlighting: run it once input has been idle for 150ms"""
+        # Also lets the Text class bindings (which do the actual scrolling) run first
+        if self._highlight_after is not None:
+            self.frame.after_cancel(self._highlight_after)
+
+        def run_highlight():
+            self._highlight_after = None
+            if self._urls_dirty:
+                self._rescan_urls()
+            self._highlight_urls()
+
+        self._highlight_after = self.frame.after(150, run_highlight)
+
+    def _on_text_key(self, event):
+        """Record whether a keystroke can only edit the line holding the insert cursor
+
+        Runs before the Text class binding applies the key, so the flag is already set
+        when the resulting <<Modified>> event arrives.
+        """
+        text_widget = self._text_widget
+        # BackSpace/Delete carry control characters in event.char, so test their keysyms first;
+        # joining two lines is still caught by the line-count check in _on_text_modified
+        self._single_line_edit = bool(
+            (event.keysym in ("BackSpace", "Delete") or (event.char and event.char.isprintable()))
+            and not text_widget.tag_ranges("sel")
+        )
+        if self._single_line_edit:
+            # A key that changes nothing (e.g. BackSpace at the start) must not leave the flag set
+            # for a later paste or undo; <<Modified>> fires before idle callbacks run
+            text_widget.after_idle(self._clear_single_line_edit)
+
+    def _clear_single_line_edit(self):
+        """Forget the keystroke recorded by _on_text_key"""
+        self._single_line_edit = False
+
+    def _on_text_modified(self, event=None):
+        """Track edits to the batch text, rescanning only the edited line when possible"""
+        text_widget = self._text_widget
+
+        # Resetting the flag below fires <<Modified>> again; ignore that event
+        if not text_widget.edit_modified():
+            return
+        text_widget.edit_modified(False)
+        self._text_generation += 1
+
+        # Only plain typing is known to touch a single line; pastes over a selection and
+        # undo/redo can rewrite several lines while keeping the line count
+        single_line_edit = self._single_line_edit
+        self._single_line_edit = False
+
+        line_count = int(text_widget.index("end-1c").split('.')[0])
+        if single_line_edit and not self._urls_dirty and line_count == len(self._line_texts):
+            line = int(text_widget.index("insert").split('.')[0])
+            line_text = text_widget.get(f"{line}.0", f"{line}.end")
+            if line_text != self._line_texts[line - 1]:
+                # Typing within a single line: update just that line's URLs and tags
+                self._set_line_urls(line - 1, line_text)
+                self._count_urls()
+                self._tag_url_lines(line, line)
+                return
+
+        # Lines were added, removed or replaced (paste, Enter, cut, undo...): rescan everything once input settles
+        self._urls_dirty = True
+        self._schedule_highlight()
+
+    def _set_line_urls(self, index, line_text):
+        """Replace the recorded text and URLs of one line
+
+        Args:
+            index: Zero-based line index
+            line_text: New text of the line
+        """
+        for url in self._line_urls[index]:
+            self._url_counts[url] -= 1
+            if not self._url_counts[url]:
+                del self._url_counts[url]
+
+        urls = extract_urls_from_text(line_text)
+        self._url_counts.update(urls)
+        self._line_urls[index] = urls
+        self._line_texts[index] = line_text
+
+    def _rescan_urls(self):
+        """Rebuild the per-line URL records from the whole batch text"""
+        # URLs never span lines (the pattern has no whitespace), so per-line results add up
+        self._line_texts = self.batch_text.get("1.0", "end-1c").split('\n')
+        self._line_urls = [extract_urls_from_text(line) if line else [] for line in self._line_texts]
+        self._url_counts = Counter(url for urls in self._line_urls for url in urls)
+        self._urls_dirty = False
+
     def _highlight_urls(self, event=None):
-        """Highlight valid URLs in the text input"""
+        """Highlight valid URLs in the visible part of the text input"""
         # Count URLs first
         self._count_urls()
 
         if not hasattr(self, 'batch_text'):
             return
 
-        # Get all text
-        content = self.batch_text.get(1.0, tk.END)
+        # Only the lines currently on screen are scanned and tagged
+        text_widget = self._text_widget
+        first_line = int(text_widget.index("@0,0").split('.')[0])
+        last_line = int(text_widget.index(f"@0,{text_widget.winfo_height()}").split('.')[0])
+        self._tag_url_lines(first_line, last_line)
 
-        # Clear existing tags
-        self.batch_text.tag_remove("valid_url", "1.0", tk.END)
-        self.batch_text.tag_remove("invalid_url", "1.0", tk.END)
+    def _tag_url_lines(self, first_line, last_line):
+        """Re-tag the URLs on a range of lines
 
-        # Configure tags
-        self.batch_text.tag_configure("valid_url", foreground="green")
-        self.batch_text.tag_configure("invalid_url", foreground="red")
+        Args:
+            first_line: First line to tag (1-based)
+            last_line: Last line to tag (inclusive)
+        """
+        view_start = f"{first_line}.0"
+        view_end = f"{last_line}.end"
 
-        # Extract URLs from text
-        urls = extract_urls_from_text(content)
+        # Get the text of the lines
+        content = self.batch_text.get(view_start, view_end)
 
-        # Find and tag all URLs
-        for url in urls:
-            # Escape special regex characters in the URL
-            escaped_url = re.escape(url)
+        # Clear existing tags in the range
+        self.batch_text.tag_remove("valid_url", view_start, view_end)
+        self.batch_text.tag_remove("invalid_url", view_start, view_end)
 
-            # Find all occurrences of the URL in the text
-            for match in re.finditer(escaped_url, content):
-                start_idx = match.start()
-                end_idx = match.end()
+        # Extract URLs from text
+        urls = _extract_urls_cached(content)
 
-                # Calculate line and column
-                start_line = content[:start_idx].count('\n') + 1
-                start_col = start_idx - content[:start_idx].rfind('\n') - 1
+        if not urls:
+            return
 
-                end_line = content[:end_idx].count('\n') + 1
-                end_col = end_idx - content[:end_idx].rfind('\n') - 1
+        # One alternation of all URLs (longest first, so a URL wins over its own prefix),
+        # rebuilt only when the set of URLs changes
+        url_key = urls
+        if url_key != self._url_pattern_key:
+            self._url_pattern = "|".join(re.escape(url) for url in sorted(urls, key=len, reverse=True))
+            self._url_pattern_key = url_key
+
+        # Let Tk's own regex search walk the range: it returns text indices directly,
+        # so no line/column arithmetic happens in Python
+        search_count = self._search_count
+        index = view_start
+        while True:
+            index = self.batch_text.search(
+                self._url_pattern, index, view_end, regexp=True, count=search_count
+            )
+            if not index:
+                break
 
-                start_pos = f"{start_line}.{start_col}"
-                end_pos = f"{end_line}.{end_col}"
+            end_index = f"{index}+{search_count.get()}c"
 
-                # Always tag as valid_url when extracted by extract_urls_from_text
-                self.batch_text.tag_add("valid_url", start_pos, end_pos)
+            # Always tag as valid_url when extracted by extract_urls_from_text
+            self.batch_text.tag_add("valid_url", index, end_index)
+            index = end_index
 
     def _count_urls(self):
         """Count and update the URL counter"""
         if not hasattr(self, 'batch_text') or not hasattr(self, 'url_count_var'):
             return
 
-        content = self.batch_text.get(1.0, tk.END)
-        urls = extract_urls_from_text(content)
-
-        # Update the counter
-        url_count = len(urls)
+        # Update the counter from the per-line records kept by _on_text_modified
+        url_count = len(self._url_counts)
         if url_count == 1:
-            self.url_count_var.set(f"1 URL")
+            self._set(self.url_count_var, "1 URL")
         else:
-            self.url_count_var.set(f"{url_count} URLs")
+            self._set(self.url_count_var, f"{url_count} URLs")
 
     def _update_elapsed_time(self):
         """Update the elapsed time display"""
@@ -614,7 +928,21 @@ class BatchTab:
         seconds = elapsed_seconds % 60
 
         # Update display
-        self.elapsed_var.set(f"{hours:02d}:{minutes:02d}:{seconds:02d}")
+        self._set(self.elapsed_var, f"{hours:02d}:{minutes:02d}:{seconds:02d}")
+
+    def _set(self, var, value):
+        """Set a Tk variable only if its value changes
+
+        Every write fires the variable's traces and redraws the bound widgets,
+        even when the text is identical.
+
+        Args:
+            var: Tk variable to update
+            value: New value (converted to str)
+        """
+        value = str(value)
+        if var.get() != value:
+            var.set(value)
 
     def _format_time(self, seconds):
         """Format seconds into HH:MM:SS"""
@@ -660,7 +988,6 @@ class BatchTab:
                 self.batch_text.insert(tk.END, "\n")
 
             self.batch_text.insert(tk.END, "\n".join(urls))
-            self._highlight_urls()
 
             # Show success message
             ToastNotification(
@@ -697,23 +1024,25 @@ class BatchTab:
             return
 
         try:
+            # Build the whole report in memory and write it with a single call
+            buffer = io.StringIO()
+            buffer.write(f"=== {self.translator.translate('batch_tab', 'download_results')} ===\n\n")
+            buffer.write(f"{self.translator.translate('batch_tab', 'date')}: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+            buffer.write(f"{self.translator.translate('batch_tab', 'total_videos')}: {len(self.successful_urls) + len(self.failed_urls)}\n")
+            buffer.write(f"{self.translator.translate('batch_tab', 'successful')}: {len(self.successful_urls)}\n")
+            buffer.write(f"{self.translator.translate('batch_tab', 'failed')}: {len(self.failed_urls)}\n\n")
+
+            if self.successful_urls:
+                buffer.write(f"=== {self.translator.translate('batch_tab', 'successful_downloads')} ===\n")
+                buffer.write("".join(f"- {url}\n" for url in self.successful_urls))
+                buffer.write("\n")
+
+            if self.failed_urls:
+                buffer.write(f"=== {self.translator.translate('batch_tab', 'failed_downloads')} ===\n")
+                buffer.write("".join(f"- {url}\n" for url in self.failed_urls))
+
             with open(file_path, 'w', encoding='utf-8') as file:
-                file.write(f"=== {self.translator.translate('batch_tab', 'download_results')} ===\n\n")
-                file.write(f"{self.translator.translate('batch_tab', 'date')}: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-                file.write(f"{self.translator.translate('batch_tab', 'total_videos')}: {len(self.successful_urls) + len(self.failed_urls)}\n")
-                file.write(f"{self.translator.translate('batch_tab', 'successful')}: {len(self.successful_urls)}\n")
-                file.write(f"{self.translator.translate('batch_tab', 'failed')}: {len(self.failed_urls)}\n\n")
-
-                if self.successful_urls:
-                    file.write(f"=== {self.translator.translate('batch_tab', 'successful_downloads')} ===\n")
-                    for url in self.successful_urls:
-                        file.write(f"- {url}\n")
-                    file.write("\n")
-
-                if self.failed_urls:
-                    file.write(f"=== {self.translator.translate('batch_tab', 'failed_downloads')} ===\n")
-                    for url in self.failed_urls:
-                        file.write(f"- {url}\n")
+                file.write(buffer.getvalue())
 
             # Show success message
             self._show_toast(
@@ -723,7 +1052,7 @@ class BatchTab:
             )
 
             # Open the file location
-            folder_path = file_path.rsplit('/', 1)[0] if '/' in file_path else file_path.rsplit('\\', 1)[0]
+            folder_path = os.path.dirname(file_path)
             if folder_path:
                 open_folder(folder_path)
             else:
@@ -735,48 +1064,49 @@ class BatchTab:
                 self.translator.translate("batch_tab", "export_error").format(error=str(e))
             )
 
+    def _translatable(self, widget, key, prefix=""):
+        """Register a widget whose text update_language should retranslate
+
+        Args:
+            widget: Widget with a text option
+            key: Translation key in the batch_tab module
+            prefix: Text kept in front of the translation (e.g. an icon)
+
+        Returns:
+            The widget, so creation and registration can be chained
+        """
+        self._i18n.append((widget, key, prefix))
+        return widget
+
+    def _snapshot_translations(self):
+        """Look up the strings used for every download result once, not per result"""
+        self._t_downloading_with_eta = self.translator.translate("batch_tab", "downloading_with_eta")
+        # Fields last rendered into the status template; emptied so the new text is applied
+        self._status_fields = {}
+
     def update_language(self):
         """Update the UI text when language changes"""
-        # Update all LabelFrames
-        for child in self.frame.winfo_children():
-            if isinstance(child, ttk.Frame):
-                for widget in child.winfo_children():
-                    if isinstance(widget, ttk.LabelFrame):
-                        if "batch_links" in str(widget).lower():
-                            widget.configure(text=self.translator.translate("batch_tab", "batch_links"))
-                        elif "download_results" in str(widget).lower():
-                            widget.configure(text=self.translator.translate("batch_tab", "download_results"))
-
-        # Update all buttons
-        for child in self.frame.winfo_children():
-            if isinstance(child, ttk.Frame):
-                for container in child.winfo_children():
-                    if isinstance(container, ttk.Frame):
-                        for widget in container.winfo_children():
-                            # Control buttons
-                            if isinstance(widget, ttk.Button):
-                                if "paste" in str(widget).lower():
-                                    widget.configure(text=self.translator.translate("batch_tab", "paste_button"))
-                                elif "clear" in str(widget).lower():
-                                    widget.configure(text=self.translator.translate("batch_tab", "clear_button"))
-                                elif "extract" in str(widget).lower():
-                                    widget.configure(text=self.translator.translate("batch_tab", "extract_urls_button"))
-                                elif "start" in str(widget).lower():
-                                    widget.configure(text=self.translator.translate("batch_tab", "start_batch_download"))
-                                elif "stop" in str(widget).lower():
-                                    widget.configure(text=self.translator.translate("batch_tab", "stop_download"))
-
-                            # Custom save location checkbox
-                            elif isinstance(widget, ttk.Checkbutton):
-                                widget.configure(text=self.translator.translate("batch_tab", "custom_save_location"))
-
-                            # Thread count label
-                            elif isinstance(widget, ttk.Label) and "concurrent" in str(widget).lower():
-                                widget.configure(text=self.translator.translate("batch_tab", "concurrent_downloads"))
+        translate = self.translator.translate
+
+        # Widgets registered in _create_widgets
+        for widget, key, prefix in self._i18n:
+            widget.configure(text=prefix + translate("batch_tab", key))
+
+        # The pause button text depends on the current state
+        self.pause_button.configure(
+            text=translate("batch_tab", "resume_download" if self.paused else "pause_download")
+        )
+
+        # Treeview column headings
+        for column, key in (("url", "video_url"), ("progress", "status"), ("time", "time")):
+            self.current_downloads.heading(column, text=translate("batch_tab", key))
+
+        # Refresh the strings snapshotted for per-result updates
+        self._snapshot_translations()
 
         # Update status if it's at default
         if self.status_var.get() in ["Ready", "就绪"]:
-            self.status_var.set(self.translator.translate("batch_tab", "status_ready"))
+            self.status_var.set(translate("batch_tab", "status_ready"))
 
     def _toggle_custom_save(self):
         """Toggle custom save location"""
@@ -809,32 +1139,79 @@ class BatchTab:
             )
             return
 
-        # Extract URLs
-        urls = extract_urls_from_text(text_content)
+        if self._extracting:
+            return
 
-        if not urls:
+        # Extraction and dedup run in a worker so large pastes do not freeze the UI
+        self._extracting = True
+        self._set(self.url_count_var, self.translator.translate("batch_tab", "extracting_urls"))
+        threading.Thread(
+            target=self._extract_worker, args=(text_content, self._text_generation), daemon=True
+        ).start()
+
+    def _extract_worker(self, text_content, generation, chunk_size=64 * 1024):
+        """Extract and deduplicate URLs in a background thread
+
+        The text is scanned in chunks cut at line breaks, so no large intermediate
+        copies are made and the running count can be shown while a huge paste is
+        still being processed.
+
+        Args:
+            text_content: Batch text captured when extraction started
+            generation: Value of _text_generation when the text was captured
+            chunk_size: Approximate number of characters scanned per chunk
+        """
+        found_urls = {}
+        unique_urls = {}
+        label = self.translator.translate("batch_tab", "extracting_urls")
+
+        position = 0
+        length = len(text_content)
+        while position < length:
+            end = text_content.find('\n', position + chunk_size)
+            if end == -1:
+                end = length
+
+            for url in extract_urls_from_text(text_content[position:end]):
+                found_urls[url] = None
+                # 更智能的去重：去除追踪参数后按插入顺序去重，保留 ?v= / ?item_id= 等标识参数。
+                # 提取结果已是规范形式（域名小写、无片段），没有查询参数时无需再解析
+                unique_urls[normalize_share_url(url) if '?' in url else url] = None
+            position = end + 1
+
+            if position < length:
+                self.app.root.after(0, self._set, self.url_count_var, f"{label} {len(unique_urls)}")
+
+        self.app.root.after(0, self._apply_extracted_urls, generation, list(unique_urls), len(found_urls))
+
+    def _apply_extracted_urls(self, generation, unique_urls, total_found):
+        """Replace the batch text with extracted URLs (runs on the Tk thread)
+
+        Args:
+            generation: Value of _text_generation when the text was captured
+            unique_urls: Deduplicated URLs
+            total_found: Number of URLs found before deduplication
+        """
+        self._extracting = False
+
+        # Leave the text alone if it was edited while extraction was running
+        if generation != self._text_generation:
+            self._count_urls()
+            return
+
+        if not unique_urls:
+            self._count_urls()
             messagebox.showwarning(
                 self.translator.translate("batch_tab", "warning_title"),
                 self.translator.translate("batch_tab", "no_urls_found")
             )
             return
 
-        # 更智能的去重和验证
-        unique_urls = []
-        seen = set()
-        for url in urls:
-            # 标准化 URL，去除可能的尾部空格和重复查询参数
-            normalized_url = url.strip().split('?')[0]
-            if normalized_url and normalized_url not in seen:
-                unique_urls.append(normalized_url)
-                seen.add(normalized_url)
-
         # 清除并插入唯一 URL
         self.batch_text.delete(1.0, tk.END)
         self.batch_text.insert(tk.END, "\n".join(unique_urls))
 
         # 显示去重和验证结果
-        total_found = len(urls)
         unique_count = len(unique_urls)
 
         # 根据去重结果显示不同的消息
@@ -891,6 +1268,10 @@ class BatchTab:
             return
 
         self.paused = not self.paused
+        if self.paused:
+            self._resume_event.clear()
+        else:
+            self._resume_event.set()
 
         if self.paused:
             # Update button to show resume
@@ -910,6 +1291,7 @@ class BatchTab:
             if HAS_TTKBOOTSTRAP_EXTENSIONS:
                 try:
                     self.progress.configure(bootstyle=(WARNING, STRIPED))
+                    self._progress_color = None
                 except:
                     pass
         else:
@@ -930,6 +1312,7 @@ class BatchTab:
             if HAS_TTKBOOTSTRAP_EXTENSIONS:
                 try:
                     self.progress.configure(bootstyle=(SUCCESS, STRIPED))
+                    self._progress_color = SUCCESS
                 except:
                     pass
 
@@ -958,8 +1341,8 @@ class BatchTab:
             )
             return
 
-        # Extract URLs from text
-        urls = extract_urls_from_text(text_content)
+        # Extract URLs from text (order-preserving dedup, so a pasted duplicate is fetched once)
+        urls = list(dict.fromkeys(extract_urls_from_text(text_content)))
 
         if not urls:
             messagebox.showwarning(
@@ -968,6 +1351,16 @@ class BatchTab:
             )
             return
 
+        # Skip URLs already downloaded successfully in an earlier batch of this session
+        pending_urls = [url for url in urls if url not in self._successful_set]
+        if not pending_urls:
+            messagebox.showinfo(
+                self.translator.translate("batch_tab", "info_title"),
+                self.translator.translate("batch_tab", "urls_already_downloaded").format(count=len(urls))
+            )
+            return
+        urls = pending_urls
+
         # Confirm large downloads
         if len(urls) > 10:
             confirm = messagebox.askyesno(
@@ -993,7 +1386,10 @@ class BatchTab:
         self.is_downloading = True
         self.stop_download = False
         self.paused = False
+        self._resume_event.set()
+        self._batch_finished.clear()
         self.start_time = time.time()
+        self._snapshot_translations()
 
         # Update UI
         self.download_button.config(state=tk.DISABLED)
@@ -1004,10 +1400,12 @@ class BatchTab:
         if HAS_TTKBOOTSTRAP_EXTENSIONS:
             try:
                 self.progress.configure(bootstyle=(SUCCESS, STRIPED))
+                self._progress_color = SUCCESS
             except:
                 pass
 
         # Clear current downloads
+        self._row_updates.clear()
         for item in self.current_downloads.get_children():
             self.current_downloads.delete(item)
 
@@ -1016,8 +1414,9 @@ class BatchTab:
         self.failed = 0
         self.successful_urls = []
         self.failed_urls = []
-        self.download_times = []
-        self.currently_downloading = set()
+        self._times_sum = 0.0
+        self._times_count = 0
+        self._download_items = {}
 
         # Reset progress
         self._update_progress(0, len(urls))
@@ -1030,6 +1429,10 @@ class BatchTab:
 
         # Get thread count from UI
         self.max_workers = self.thread_count_var.get()
+        # The thread count (capped to what the HTTP connection pools can serve) is the ceiling;
+        # how many downloads actually run follows throughput. Paused workers wait before taking
+        # a slot, so extra threads never hold connections.
+        self._concurrency = _AdaptiveConcurrency(min(self.max_workers, MAX_CONCURRENT_HTTP_DOWNLOADS))
 
         # Create downloader with current settings
         downloader = VideoDownloader(
@@ -1070,39 +1473,47 @@ class BatchTab:
         if self.stop_download:
             return (False, url, 0, "Download stopped by user")
 
-        # Add to currently downloading list
-        self.app.root.after(0, lambda: self._add_to_current_downloads(url))
-
-        # Handle pause state
-        while self.paused and not self.stop_download:
+        # Handle pause state: block without polling until resumed (stopping also resumes)
+        if not self._resume_event.is_set():
             # Update UI to show paused status
-            self.app.root.after(0, lambda u=url: self._update_download_status(u, "Paused"))
-            time.sleep(0.5)
+            self._queue_row_update(url, "Paused")
+            self._resume_event.wait()
+            # The row comes back once a download slot is free
+            self._queue_row_update(url, None)
 
         if self.stop_download:
-            self.app.root.after(0, lambda u=url: self._remove_from_current_downloads(u))
+            self._queue_row_update(url, None)
+            return (False, url, 0, "Download stopped by user")
+
+        # Wait for a slot under the adaptive concurrency target
+        concurrency = self._concurrency
+        if not concurrency.acquire():
+            self._queue_row_update(url, None)
             return (False, url, 0, "Download stopped by user")
 
+        # Add to currently downloading list only once a slot is held, so waiting workers are not counted as active
+        self._queue_row_update(url, "Starting")
+
         # Start timing
         start_time = time.time()
         try:
             # Update status
-            self.app.root.after(0, lambda u=url: self._update_download_status(u, "Fetching info"))
+            self._queue_row_update(url, "Fetching info")
 
             # Get video info using the refactored API
             video_info = self.app.client.get_data(url, clean_data=True)
 
             if not video_info:
-                self.app.root.after(0, lambda u=url: self._remove_from_current_downloads(u))
+                self._queue_row_update(url, None)
                 return (False, url, time.time() - start_time, "Failed to retrieve video info")
 
             # Check if video_urls exists in the response
             if not video_info.get('video_urls'):
-                self.app.root.after(0, lambda u=url: self._remove_from_current_downloads(u))
+                self._queue_row_update(url, None)
                 return (False, url, time.time() - start_time, "No video URLs found in response")
 
             # Update status
-            self.app.root.after(0, lambda u=url: self._update_download_status(u, "Downloading"))
+            self._queue_row_update(url, "Downloading")
 
             # Create progress callback for this download
             def progress_callback(current, total):
@@ -1121,7 +1532,7 @@ class BatchTab:
             )
 
             # Remove from current downloads
-            self.app.root.after(0, lambda u=url: self._remove_from_current_downloads(u))
+            self._queue_row_update(url, None)
 
             if result['success'] and result['files']:
                 return (True, url, time.time() - start_time, None)
@@ -1130,123 +1541,176 @@ class BatchTab:
                 return (False, url, time.time() - start_time, error_msg)
 
         except Exception as e:
-            print(f"Error downloading video {url}: {e}")
+            self.logger.exception(f"Error downloading video {url}: {e}")
             # Remove from current downloads
-            self.app.root.after(0, lambda u=url: self._remove_from_current_downloads(u))
+            self._queue_row_update(url, None)
             return (False, url, time.time() - start_time, str(e))
+        finally:
+            concurrency.release()
+
+    def _queue_row_update(self, url, status):
+        """Queue a change to a "currently downloading" row from a worker thread
+
+        Args:
+            url: Video URL of the row
+            status: New status text, or None to remove the row
+        """
+        self._row_updates.append((url, status))
+        self._schedule_drain()
+
+    def _apply_row_updates(self):
+        """Apply all queued row changes to the Treeview in one pass"""
+        # Only the latest state of each row matters
+        latest = {}
+        while True:
+            try:
+                url, status = self._row_updates.popleft()
+            except IndexError:
+                break
+            latest[url] = status
+
+        finished = []
+        for url, status in latest.items():
+            if status is None:
+                finished.append(url)
+            elif url in self._download_items:
+                self._update_download_status(url, status)
+            else:
+                self._add_to_current_downloads(url, status)
 
-    def _add_to_current_downloads(self, url):
+        if finished:
+            self._remove_from_current_downloads(finished)
+
+    def _add_to_current_downloads(self, url, status="Starting"):
         """Add URL to the currently downloading list"""
-        if url in self.currently_downloading:
+        if url in self._download_items:
             return
 
-        # Add to tracking set
-        self.currently_downloading.add(url)
-
-        # Add to UI
+        # Add to UI (the truncated URL is computed once and kept with the row)
         display_url = url[:40] + "..." if len(url) > 40 else url
-        item_id = self.current_downloads.insert("", "end", values=(display_url, "Starting", "0s"))
+        item_id = self.current_downloads.insert("", "end", values=(display_url, status, "0s"))
 
-        # Store the item ID with the URL for later updates
-        setattr(self, f"download_item_{hash(url)}", item_id)
+        # Store the item ID, start time and display text with the URL for later updates
+        self._download_items[url] = {"item_id": item_id, "start": time.time(), "display_url": display_url}
 
     def _update_download_status(self, url, status):
         """Update the status of a downloading item"""
-        if url not in self.currently_downloading:
-            return
-
-        # Get the item ID
-        item_id = getattr(self, f"download_item_{hash(url)}", None)
-        if not item_id:
+        # Get the row state
+        download_item = self._download_items.get(url)
+        if not download_item:
             return
 
         # Calculate elapsed time for this download
-        now = time.time()
-        start_time = getattr(self, f"download_start_{hash(url)}", now)
-        elapsed = int(now - start_time)
-
-        # Store start time if not already set
-        if not hasattr(self, f"download_start_{hash(url)}"):
-            setattr(self, f"download_start_{hash(url)}", now)
-
-        # Update the item in the treeview
-        self.current_downloads.item(item_id, values=(
-            url[:40] + "..." if len(url) > 40 else url,
-            status,
-            f"{elapsed}s"
-        ))
+        elapsed = int(time.time() - download_item["start"])
 
-    def _remove_from_current_downloads(self, url):
-        """Remove URL from the currently downloading list"""
-        if url not in self.currently_downloading:
-            return
-
-        # Remove from tracking set
-        self.currently_downloading.remove(url)
+        # Update only the columns that change; the URL column is left as inserted
+        item_id = download_item["item_id"]
+        self.current_downloads.set(item_id, "progress", status)
+        self.current_downloads.set(item_id, "time", f"{elapsed}s")
 
-        # Remove from UI
-        item_id = getattr(self, f"download_item_{hash(url)}", None)
-        if item_id:
-            self.current_downloads.delete(item_id)
+    def _remove_from_current_downloads(self, urls):
+        """Remove URLs from the currently downloading list
 
-        # Clean up attributes
-        if hasattr(self, f"download_item_{hash(url)}"):
-            delattr(self, f"download_item_{hash(url)}")
+        Args:
+            urls: URLs whose rows should be removed
+        """
+        item_ids = []
+        for url in urls:
+            # Collect the row to remove from UI
+            download_item = self._download_items.pop(url, None)
+            if download_item:
+                item_ids.append(download_item["item_id"])
+
+        # Remove all rows with a single Treeview call
+        if item_ids:
+            self.current_downloads.delete(*item_ids)
+
+    def _on_download_progress(self, event=None):
+        """Coalesce worker notifications into at most one UI drain every 100ms"""
+        # A drain already scheduled will pick up this change as well
+        if self._drain_after is not None:
+            return
+        self._drain_after = self.frame.after(100, self._drain_download_updates)
 
-        if hasattr(self, f"download_start_{hash(url)}"):
-            delattr(self, f"download_start_{hash(url)}")
+    def _drain_download_updates(self):
+        """Apply all row changes and results queued since the last drain"""
+        self._drain_after = None
+        self._drain_scheduled = False
+        self._process_results_queue()
 
     def _process_results_queue(self):
         """Process results from the queue and update UI"""
-        try:
-            # Process all available results without blocking
-            while not self.result_queue.empty():
-                success, url, download_time, error_message = self.result_queue.get_nowait()
-
-                with self.lock:
-                    if success:
-                        self.completed += 1
-                        self.successful_urls.append(url)
-                        self.download_times.append(download_time)
-
-                        # Update success counter
-                        self.success_var.set(str(self.completed))
-                    else:
-                        self.failed += 1
-                        self.failed_urls.append(url)
-                        if error_message:
-                            self.logger.error(f"Failed to download {url}: {error_message}")
-
-                        # Update failed counter
-                        self.failed_var.set(str(self.failed))
-
-                    total = self.completed + self.failed
-                    self._update_progress(total, self.total_urls)
-
-                    # Update estimated time
-                    if self.download_times:
-                        avg_download_time = sum(self.download_times) / len(self.download_times)
-                        remaining_urls = self.total_urls - total
-
-                        # Factor in concurrency for better estimation
-                        active_threads = min(remaining_urls, self.max_workers)
-                        if active_threads > 0:
-                            estimated_remaining_time = avg_download_time * (remaining_urls / active_threads)
-
-                            # Update ETA display
-                            self.eta_var.set(self._format_time(estimated_remaining_time))
-
-                            # Update status with estimated time and active downloads
-                            status_text = self.translator.translate("batch_tab", "downloading_with_eta").format(
-                                active=len(self.currently_downloading),
-                                total=self.total_urls,
-                                eta=self._format_time(estimated_remaining_time)
-                            )
-                            self.status_var.set(status_text)
-
-                self.result_queue.task_done()
-        except queue.Empty:
-            pass
+        # Bring the currently downloading list up to date first
+        self._apply_row_updates()
+
+        # Process all available results without blocking
+        processed = False
+        while True:
+            try:
+                success, url, download_time, error_message = self.result_queue.popleft()
+            except IndexError:
+                break
+            processed = True
+
+            if success:
+                self.completed += 1
+                self.successful_urls.append(url)
+                self._successful_set.add(url)
+                self._times_sum += download_time
+                self._times_count += 1
+
+                # Update success counter
+                self._set(self.success_var, self.completed)
+            else:
+                self.failed += 1
+                self.failed_urls.append(url)
+                if error_message:
+                    self.logger.error(f"Failed to download {url}: {error_message}")
+
+                # Update failed counter
+                self._set(self.failed_var, self.failed)
+
+        # Progress and ETA only depend on the totals, so refresh them once per drain
+        if processed:
+            total = self.completed + self.failed
+            self._update_progress(total, self.total_urls)
+
+            # Update estimated time
+            if self._times_count:
+                avg_download_time = self._times_sum / self._times_count
+                remaining_urls = self.total_urls - total
+
+                # Factor in concurrency for better estimation: the limiter's current target is
+                # how many downloads actually run, not the worker thread count
+                concurrency = self._concurrency
+                parallel = concurrency.limit if concurrency else self.max_workers
+                active_threads = min(remaining_urls, parallel)
+                if active_threads > 0:
+                    estimated_remaining_time = avg_download_time * (remaining_urls / active_threads)
+
+                    # Update ETA display (formatted only when the whole-second value changes)
+                    eta_seconds = int(estimated_remaining_time)
+                    if eta_seconds != self._eta_seconds:
+                        self._eta_seconds = eta_seconds
+                        self._eta_text = self._format_time(eta_seconds)
+                    eta_text = self._eta_text
+                    self._set(self.eta_var, eta_text)
+
+                    # Update status with estimated time and active downloads; the template is
+                    # re-rendered (format_map over one reused dict) only when a field changes
+                    fields = self._status_fields
+                    active = len(self._download_items)
+                    if (fields.get("active") != active or fields.get("total") != self.total_urls
+                            or fields.get("eta") != eta_text):
+                        fields["active"] = active
+                        fields["total"] = self.total_urls
+                        fields["eta"] = eta_text
+                        self._set(self.status_var, self._t_downloading_with_eta.format_map(fields))
+
+        # All futures are done and their results applied: finalize the batch
+        if self._batch_finished.is_set() and not self.result_queue:
+            self._batch_finished.clear()
+            self._on_batch_download_complete()
 
     def _batch_download_thread(self, urls, downloader):
         """Background thread function for batch download using thread pool
@@ -1258,52 +1722,63 @@ class BatchTab:
         try:
             self.total_urls = len(urls)
 
-            # Create a thread pool
+            # Create a thread pool (kept on self so _stop_download can cancel queued work)
             with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                self._executor = executor
+
                 # Submit all download tasks
                 futures = []
                 for i, url in enumerate(urls):
                     if self.stop_download:
                         break
 
-                    future = executor.submit(
-                        self._download_single_video,
-                        url,
-                        downloader,
-                        i + 1,
-                        self.total_urls
-                    )
+                    try:
+                        future = executor.submit(
+                            self._download_single_video,
+                            url,
+                            downloader,
+                            i + 1,
+                            self.total_urls
+                        )
+                    except RuntimeError:
+                        # The pool was shut down by _stop_download while submitting
+                        break
                     futures.append(future)
 
-                # Wait for all futures to complete
-                for future in futures:
-                    if not self.stop_download:
-                        try:
-                            result = future.result()
-                            self.result_queue.put(result)
-                        except Exception as e:
-                            print(f"Future exception: {e}")
-
-            # Ensure all results are processed
-            self.app.root.after(500, self._process_results_queue)
+                # Post each result as soon as its download finishes, so one slow
+                # download does not hold back the ones submitted after it
+                for future in as_completed(futures):
+                    if self.stop_download:
+                        break
+                    try:
+                        result = future.result()
+                        self._post_result(result)
+                    except Exception as e:
+                        self.logger.exception(f"Future exception: {e}")
 
-            # Wait for the queue to be fully processed
-            self.result_queue.join()
+            self._executor = None
 
-            # Finalize download
-            self.app.root.after(500, self._on_batch_download_complete)
+            # Every result has been queued; the next drain finalizes the batch
+            self._batch_finished.set()
+            self._schedule_drain()
 
         except Exception as e:
-            print(f"Batch download error: {e}")
+            self.logger.exception(f"Batch download error: {e}")
             self.app.root.after(0, lambda:
                 messagebox.showerror(
                     self.translator.translate("batch_tab", "download_error"),
                     str(e)
                 )
             )
+        finally:
+            # 线程池退出时所有下载都已结束，释放下载器占用的资源
+            downloader.close()
 
     def _on_batch_download_complete(self):
         """Handle batch download completion"""
+        # Account for any results not drained yet
+        self._process_results_queue()
+
         # Reset UI state
         self.is_downloading = False
         self.download_button.config(state=tk.NORMAL)
@@ -1316,7 +1791,7 @@ class BatchTab:
         # Clean up any remaining items in current downloads
         for item in self.current_downloads.get_children():
             self.current_downloads.delete(item)
-        self.currently_downloading.clear()
+        self._download_items.clear()
 
         # Update status and progress
         total = self.total_urls
@@ -1329,6 +1804,7 @@ class BatchTab:
         ))
         self.progress_var.set(f"{completed}/{total}")
         self.progress["value"] = 100
+        self._progress_value = 100
         self.percent_var.set("100%")
 
         # Set progress bar color based on results if possible
@@ -1340,6 +1816,7 @@ class BatchTab:
                     self.progress.configure(bootstyle=INFO)
                 else:
                     self.progress.configure(bootstyle=WARNING)
+                self._progress_color = None
             except:
                 pass
 
@@ -1407,6 +1884,12 @@ class BatchTab:
             # Update UI
             self.stop_download = True
             self.paused = False
+            self._resume_event.set()  # Wake paused workers so they can exit
+            # Drop downloads that have not started yet; running ones finish their current step
+            if self._executor:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+            if self._concurrency:
+                self._concurrency.close()
             self.stop_button.config(state=tk.DISABLED)
             self.pause_button.config(state=tk.DISABLED)
             self.status_var.set(self.translator.translate("batch_tab", "download_stopped"))
@@ -1415,6 +1898,7 @@ class BatchTab:
             if HAS_TTKBOOTSTRAP_EXTENSIONS:
                 try:
                     self.progress.configure(bootstyle=(DANGER, STRIPED))
+                    self._progress_color = None
                 except:
                     pass
 
@@ -1438,21 +1922,19 @@ class BatchTab:
         else:
             value = 0
 
-        self.progress_var.set(f"{current}/{total}")
-        self.progress["value"] = value
-        self.percent_var.set(f"{value}%")
+        self._set(self.progress_var, f"{current}/{total}")
+        if self._progress_value != value:
+            self.progress["value"] = value
+            self._progress_value = value
+        self._set(self.percent_var, f"{value}%")
 
         # Only update progress bar color if ttkbootstrap has advanced features
-        if HAS_TTKBOOTSTRAP_EXTENSIONS:
-            try:
-                if value > 0:
-                    if value < 30:
-                        self.progress.configure(bootstyle=(SUCCESS, STRIPED))
-                    elif value < 70:
-                        self.progress.configure(bootstyle=(INFO, STRIPED))
-                    else:
-                        self.progress.configure(bootstyle=(SUCCESS, STRIPED))
-            except:
-                pass
-
-        self.app.root.update_idletasks()
\ No newline at end of file
+        if HAS_TTKBOOTSTRAP_EXTENSIONS and value > 0:
+            color = INFO if 30 <= value < 70 else SUCCESS
+            # Restyling rebuilds the widget's ttk style, so only do it when the color changes
+            if color != self._progress_color:
+                try:
+                    self.progress.configure(bootstyle=(color, STRIPED))
+                    self._progress_color = color
+                except:
+                    pass
\ No newline at end of file
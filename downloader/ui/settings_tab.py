@@ -2,25 +2,62 @@
 Settings tab for TikHub Downloader with enhanced functionality
 """
 
+import functools
 import logging
 import os
 import re
 import tkinter as tk
 import webbrowser
-import threading
 from tkinter import filedialog, messagebox
 
-import httpx
 import ttkbootstrap as ttk
 
 from downloader.constants import ABOUT_TEXT_CN, ABOUT_TEXT_EN
 from downloader.constants import APP_VERSION
-from downloader.locales.translate import Translator
+
+# 各处反复使用的固定界面文字：(翻译键, 缺省文字)，每种语言只解析一次
+_UI_STRING_KEYS = (
+    ("clear_button", "Clear"),
+    ("reset_button", "Reset"),
+    ("show_details", "Show Details"),
+    ("visit_website", "Visit Website"),
+    ("close_button", "Close"),
+    ("about_frame", "About"),
+    ("checking_update", "Checking for Updates"),
+    ("checking_for_updates", "Checking for updates, please wait..."),
+    ("error", "Error"),
+    ("update_available", "Update Available"),
+    ("update_available_title", "New Version Available!"),
+    ("download_update", "Download Update"),
+    ("version_check", "Version Check"),
+)
+
+# 版本号末尾的 .0 段，如 "1.2.0" -> "1.2"
+_TRAILING_ZEROS = re.compile(r'(\.0+)*$')
+
+
+@functools.lru_cache(maxsize=64)
+def _normalize_version(version):
+    """Convert a version string to a comparable tuple of ints
+
+    Args:
+        version: Version string such as "1.2.0"
+
+    Returns:
+        tuple: Version components without trailing zeros, e.g. (1, 2)
+    """
+    return tuple(int(x) for x in _TRAILING_ZEROS.sub('', version).split("."))
 
 
 class SettingsTab:
     """Settings tab UI and functionality"""
 
+    # 语言代码 -> {翻译键: 文字}，所有实例共享
+    _STRING_CACHE = {}
+
+    # about 对话框语言 -> 预先切分好的 Text.insert 参数
+    _ABOUT_SEGMENTS = {}
+
     def __init__(self, parent, app):
         """Initialize the settings tab
 
@@ -43,8 +80,11 @@ class SettingsTab:
         # Update check URL
         self.update_check_url = self.app.config.get('update_check_url')
 
-        # Get translator from app or create a new one if not available
-        self.translator = getattr(self.app, 'translator', Translator(self.app.config.get('language', 'en')))
+        # Use the translator created once at app startup
+        self.translator = self.app.translator
+
+        # 按最新版本号缓存格式化后的更新提示（界面语言只在重启后变化）
+        self._format_update_message = functools.lru_cache(maxsize=16)(self._build_update_message)
 
         # Settings
         self.auto_open_var = tk.BooleanVar(value=self.app.config.get('auto_open_folder', True))
@@ -65,15 +105,20 @@ class SettingsTab:
         logging.info(f"SettingsTab initialized with language: {current_language}")
 
         # Create UI components
+        # frame 由调用方在构建完成后才加入 Notebook，构建期间未映射，不会逐个触发重绘；
+        # 因此这里不要提前 pack/grid self.frame
         self._create_widgets()
 
     def _create_widgets(self):
         """Create tab UI components"""
+        tr = self.translator.translate
+        S = self._ui_strings()
+
         # API key settings
-        api_frame = ttk.LabelFrame(self.frame, text=self.translator.translate("settings_tab", "api_settings"))
+        api_frame = ttk.LabelFrame(self.frame, text=tr("settings_tab", "api_settings"))
         api_frame.pack(fill=tk.X, padx=10, pady=10)
 
-        api_key_label = ttk.Label(api_frame, text=self.translator.translate("settings_tab", "api_key_label"))
+        api_key_label = ttk.Label(api_frame, text=tr("settings_tab", "api_key_label"))
         api_key_label.grid(row=0, column=0, padx=5, pady=5, sticky=tk.W)
 
         self.api_key_var = tk.StringVar()
@@ -83,37 +128,37 @@ class SettingsTab:
 
         paste_button = ttk.Button(
             api_frame,
-            text=self.translator.translate("settings_tab", "paste_button"),
+            text=tr("settings_tab", "paste_button"),
             command=self._paste_api_key
         )
         paste_button.grid(row=0, column=2, padx=5, pady=5)
 
         clear_button = ttk.Button(
             api_frame,
-            text=self.translator.translate("settings_tab", "clear_button") or "Clear",
+            text=S["clear_button"],
             command=self._clear_api_key
         )
         clear_button.grid(row=0, column=3, padx=5, pady=5)
 
         show_key_button = ttk.Button(
             api_frame,
-            text=self.translator.translate("settings_tab", "show_button"),
+            text=tr("settings_tab", "show_button"),
             command=lambda: self._toggle_show_password(api_key_entry)
         )
         show_key_button.grid(row=0, column=4, padx=5, pady=5)
 
-        api_key_info = ttk.Label(api_frame, text=self.translator.translate("settings_tab", "api_key_info"))
+        api_key_info = ttk.Label(api_frame, text=tr("settings_tab", "api_key_info"))
         api_key_info.grid(row=1, column=0, columnspan=2, padx=5, pady=5, sticky=tk.W)
 
         open_tikhub_button = ttk.Button(
             api_frame,
-            text=self.translator.translate("settings_tab", "open_tikhub_button"),
+            text=tr("settings_tab", "open_tikhub_button"),
             command=lambda: webbrowser.open("https://user.tikhub.io/users/api_keys")
         )
         open_tikhub_button.grid(row=1, column=2, padx=5, pady=5, columnspan=3)
 
         # Add API URL configuration
-        api_url_label = ttk.Label(api_frame, text=self.translator.translate("settings_tab", "api_url_label") or "API URL:")
+        api_url_label = ttk.Label(api_frame, text=tr("settings_tab", "api_url_label") or "API URL:")
         api_url_label.grid(row=2, column=0, padx=5, pady=5, sticky=tk.W)
 
         self.api_url_var = tk.StringVar()
@@ -123,23 +168,23 @@ class SettingsTab:
 
         reset_url_button = ttk.Button(
             api_frame,
-            text=self.translator.translate("settings_tab", "reset_button") or "Reset",
+            text=S["reset_button"],
             command=self._reset_api_url
         )
         reset_url_button.grid(row=2, column=2, padx=5, pady=5)
 
         save_api_button = ttk.Button(
             api_frame,
-            text=self.translator.translate("settings_tab", "save_api_button"),
+            text=tr("settings_tab", "save_api_button"),
             command=self._save_api_key
         )
         save_api_button.grid(row=3, column=1, padx=5, pady=5)
 
         # Download path settings
-        path_frame = ttk.LabelFrame(self.frame, text=self.translator.translate("settings_tab", "download_settings"))
+        path_frame = ttk.LabelFrame(self.frame, text=tr("settings_tab", "download_settings"))
         path_frame.pack(fill=tk.X, padx=10, pady=10)
 
-        path_label = ttk.Label(path_frame, text=self.translator.translate("settings_tab", "download_path_label"))
+        path_label = ttk.Label(path_frame, text=tr("settings_tab", "download_path_label"))
         path_label.grid(row=0, column=0, padx=5, pady=5, sticky=tk.W)
 
         self.path_var = tk.StringVar()
@@ -149,7 +194,7 @@ class SettingsTab:
 
         browse_button = ttk.Button(
             path_frame,
-            text=self.translator.translate("settings_tab", "browse_button"),
+            text=tr("settings_tab", "browse_button"),
             command=self._browse_folder
         )
         browse_button.grid(row=0, column=2, padx=5, pady=5)
@@ -157,34 +202,34 @@ class SettingsTab:
         # Theme settings
         theme_frame = ttk.LabelFrame(
             self.frame,
-            text=self.translator.translate("settings_tab", "theme_settings") or "Theme Settings"
+            text=tr("settings_tab", "theme_settings") or "Theme Settings"
         )
         theme_frame.pack(fill=tk.X, padx=10, pady=10)
 
         theme_label = ttk.Label(
             theme_frame,
-            text=self.translator.translate("settings_tab", "theme_label") or "Application Theme:"
+            text=tr("settings_tab", "theme_label") or "Application Theme:"
         )
         theme_label.grid(row=0, column=0, padx=5, pady=5, sticky=tk.W)
 
         # Radio buttons for theme selection
         ttk.Radiobutton(
             theme_frame,
-            text=self.translator.translate("settings_tab", "theme_light") or "Light",
+            text=tr("settings_tab", "theme_light") or "Light",
             variable=self.theme_var,
             value="light"
         ).grid(row=0, column=1, padx=5, pady=5)
 
         ttk.Radiobutton(
             theme_frame,
-            text=self.translator.translate("settings_tab", "theme_dark") or "Dark",
+            text=tr("settings_tab", "theme_dark") or "Dark",
             variable=self.theme_var,
             value="dark"
         ).grid(row=0, column=2, padx=5, pady=5)
 
         ttk.Radiobutton(
             theme_frame,
-            text=self.translator.translate("settings_tab", "theme_system") or "System",
+            text=tr("settings_tab", "theme_system") or "System",
             variable=self.theme_var,
             value="system"
         ).grid(row=0, column=3, padx=5, pady=5)
@@ -192,15 +237,15 @@ class SettingsTab:
         # Theme note
         theme_note = ttk.Label(
             theme_frame,
-            text=self.translator.translate("settings_tab", "theme_note") or "Theme changes will take effect after restart"
+            text=tr("settings_tab", "theme_note") or "Theme changes will take effect after restart"
         )
         theme_note.grid(row=1, column=0, columnspan=4, padx=5, pady=5, sticky=tk.W)
 
         # Language settings
-        language_frame = ttk.LabelFrame(self.frame, text=self.translator.translate("settings_tab", "language_settings"))
+        language_frame = ttk.LabelFrame(self.frame, text=tr("settings_tab", "language_settings"))
         language_frame.pack(fill=tk.X, padx=10, pady=10)
 
-        language_label = ttk.Label(language_frame, text=self.translator.translate("settings_tab", "language_label"))
+        language_label = ttk.Label(language_frame, text=tr("settings_tab", "language_label"))
         language_label.grid(row=0, column=0, padx=5, pady=5, sticky=tk.W)
 
         # Get language names for UI display
@@ -223,22 +268,11 @@ class SettingsTab:
             width=20
         )
 
-        # Try to find current language index
-        try:
-            if current_display_name in language_names:
-                current_index = language_names.index(current_display_name)
-            elif current_language in self.translator.available_languages:
-                lang_idx = self.translator.available_languages.index(current_language)
-                current_index = lang_idx if lang_idx < len(language_names) else 0
-            else:
-                current_index = 0
-
-            logging.info(f"Setting dropdown to index {current_index} ({language_names[current_index] if language_names else 'N/A'})")
+        # Find current language index (dict lookups built with the language maps)
+        if language_names:
+            current_index = self.translator.get_language_index(current_language, current_display_name)
+            logging.info(f"Setting dropdown to index {current_index} ({language_names[current_index]})")
             self.language_dropdown.current(current_index)
-        except Exception as e:
-            logging.error(f"Error setting language dropdown: {str(e)}")
-            if language_names:
-                self.language_dropdown.set(language_names[0])
 
         self.language_dropdown.grid(row=0, column=1, padx=5, pady=5, sticky=tk.W)
 
@@ -248,31 +282,31 @@ class SettingsTab:
         # Add note about language change requiring restart
         language_note = ttk.Label(
             language_frame,
-            text=self.translator.translate("settings_tab", "language_note")
+            text=tr("settings_tab", "language_note")
         )
         language_note.grid(row=1, column=0, columnspan=3, padx=5, pady=5, sticky=tk.W)
 
         # Other settings
-        other_frame = ttk.LabelFrame(self.frame, text=self.translator.translate("settings_tab", "other_settings"))
+        other_frame = ttk.LabelFrame(self.frame, text=tr("settings_tab", "other_settings"))
         other_frame.pack(fill=tk.X, padx=10, pady=10)
 
         auto_open_check = ttk.Checkbutton(
             other_frame,
-            text=self.translator.translate("settings_tab", "auto_open_check"),
+            text=tr("settings_tab", "auto_open_check"),
             variable=self.auto_open_var
         )
         auto_open_check.grid(row=0, column=0, padx=5, pady=5, sticky=tk.W)
 
         skip_existing_check = ttk.Checkbutton(
             other_frame,
-            text=self.translator.translate("settings_tab", "skip_existing_check"),
+            text=tr("settings_tab", "skip_existing_check"),
             variable=self.skip_existing_var
         )
         skip_existing_check.grid(row=1, column=0, padx=5, pady=5, sticky=tk.W)
 
         rename_with_desc_check = ttk.Checkbutton(
             other_frame,
-            text=self.translator.translate("settings_tab", "rename_with_desc_check"),
+            text=tr("settings_tab", "rename_with_desc_check"),
             variable=self.rename_with_desc_var
         )
         rename_with_desc_check.grid(row=2, column=0, padx=5, pady=5, sticky=tk.W)
@@ -280,7 +314,7 @@ class SettingsTab:
         # Save settings button
         save_settings_button = ttk.Button(
             other_frame,
-            text=self.translator.translate("settings_tab", "save_settings_button"),
+            text=tr("settings_tab", "save_settings_button"),
             command=self._save_settings
         )
         save_settings_button.grid(row=3, column=0, padx=5, pady=10)
@@ -288,12 +322,12 @@ class SettingsTab:
         # Version check section - without auto-check option
         version_frame = ttk.LabelFrame(
             self.frame,
-            text=self.translator.translate("settings_tab", "version_check") or "Version Check"
+            text=S["version_check"]
         )
         version_frame.pack(fill=tk.X, padx=10, pady=10)
 
         # Show current version
-        current_version_text = self.translator.translate("settings_tab", "current_version") or "Current Version"
+        current_version_text = tr("settings_tab", "current_version") or "Current Version"
         current_version_label = ttk.Label(
             version_frame,
             text=f"{current_version_text}: {self.current_version}"
@@ -301,7 +335,7 @@ class SettingsTab:
         current_version_label.grid(row=0, column=0, padx=5, pady=5, sticky=tk.W)
 
         # Add check for updates button
-        check_update_text = self.translator.translate("settings_tab", "check_update_button") or "Check for Updates"
+        check_update_text = tr("settings_tab", "check_update_button") or "Check for Updates"
         check_update_button = ttk.Button(
             version_frame,
             text=check_update_text,
@@ -310,7 +344,7 @@ class SettingsTab:
         check_update_button.grid(row=0, column=1, padx=5, pady=5)
 
         # About information - improved implementation with popup dialog
-        about_frame = ttk.LabelFrame(self.frame, text=self.translator.translate("settings_tab", "about_frame"))
+        about_frame = ttk.LabelFrame(self.frame, text=tr("settings_tab", "about_frame"))
         about_frame.pack(fill=tk.X, padx=10, pady=10)
 
         # Create a compact about section with just summary and buttons
@@ -333,7 +367,7 @@ class SettingsTab:
         # Show Details button that opens a dialog instead of expanding in-place
         details_button = ttk.Button(
             header_frame,
-            text=self.translator.translate("settings_tab", "show_details") or "Show Details",
+            text=S["show_details"],
             command=self._show_about_dialog,
             style="Accent.TButton"  # Use an accent style to make it stand out
         )
@@ -357,7 +391,7 @@ class SettingsTab:
 
         website_button = ttk.Button(
             footer_frame,
-            text=self.translator.translate("settings_tab", "visit_website") or "Visit Website",
+            text=S["visit_website"],
             command=lambda: webbrowser.open("https://www.tikhub.io")
         )
         website_button.pack(side=tk.RIGHT)
@@ -384,12 +418,14 @@ class SettingsTab:
 
     def _show_about_dialog(self):
         """Show About information in a separate dialog window"""
+        S = self._ui_strings()
+
         # Get text based on selected language
         about_text = ABOUT_TEXT_EN if self.about_language.get() == "en" else ABOUT_TEXT_CN
 
         # Create a new dialog window
         about_dialog = tk.Toplevel(self.frame)
-        about_dialog.title(self.translator.translate("settings_tab", "about_frame") or "About")
+        about_dialog.title(S["about_frame"])
         about_dialog.geometry("1000x600")  # Larger size as requested
         about_dialog.minsize(800, 500)
 
@@ -484,7 +520,7 @@ class SettingsTab:
 
         website_button = ttk.Button(
             button_frame,
-            text=self.translator.translate("settings_tab", "visit_website") or "Visit Website",
+            text=S["visit_website"],
             command=lambda: webbrowser.open("https://www.tikhub.io")
         )
         website_button.pack(side=tk.LEFT, padx=5)
@@ -498,7 +534,7 @@ class SettingsTab:
 
         close_button = ttk.Button(
             button_frame,
-            text=self.translator.translate("settings_tab", "close_button") or "Close",
+            text=S["close_button"],
             command=about_dialog.destroy
         )
         close_button.pack(side=tk.RIGHT, padx=5)
@@ -506,46 +542,59 @@ class SettingsTab:
         # Wait for the dialog to be closed
         self.frame.wait_window(about_dialog)
 
+    @classmethod
+    def _parse_about(cls, language):
+        """Split the about text for a language into Text.insert arguments, once per language
+
+        Args:
+            language: About dialog language ("en" or "cn")
+
+        Returns:
+            tuple: Alternating (chunk, tags) values, with the ** markers removed
+        """
+        segments = cls._ABOUT_SEGMENTS.get(language)
+        if segments is None:
+            about_text = ABOUT_TEXT_EN if language == "en" else ABOUT_TEXT_CN
+
+            # 按 ** 切分：奇数下标的片段为粗体
+            parts = about_text.split("**")
+            if len(parts) % 2 == 0:
+                # 未配对的最后一个 ** 原样保留
+                parts[-2:] = [f"{parts[-2]}**{parts[-1]}"]
+
+            segments = []
+            for i, part in enumerate(parts):
+                if part:
+                    segments.extend((part, ("bold",) if i % 2 else ()))
+            segments = tuple(segments)
+            cls._ABOUT_SEGMENTS[language] = segments
+        return segments
+
     def _update_about_dialog_text(self, text_widget):
         """Update the about dialog text based on selected language"""
-        # Get text based on selected language
-        about_text = ABOUT_TEXT_EN if self.about_language.get() == "en" else ABOUT_TEXT_CN
+        # Get pre-parsed text based on selected language
+        segments = self._parse_about(self.about_language.get())
 
         # Clear and insert the text
         text_widget.config(state=tk.NORMAL)
         text_widget.delete(1.0, tk.END)
-        text_widget.insert(tk.END, about_text)
 
-        # Apply text formatting
+        # Apply text formatting; all segments go in with their tags in a single insert call
         text_widget.tag_configure("bold", font=("Helvetica", 11, "bold"))
-
-        # Find and format all bold text between ** markers
-        start = "1.0"
-        while True:
-            bold_start = text_widget.search(r"\*\*", start, tk.END, regexp=True)
-            if not bold_start:
-                break
-
-            bold_end = text_widget.search(r"\*\*", f"{bold_start}+2c", tk.END, regexp=True)
-            if not bold_end:
-                break
-
-            text_widget.tag_add("bold", bold_start, f"{bold_end}+2c")
-            text_widget.delete(bold_end, f"{bold_end}+2c")
-            text_widget.delete(bold_start, f"{bold_start}+2c")
-
-            # Adjust start position for next search
-            start = bold_end
+        if segments:
+            text_widget.insert(tk.END, *segments)
 
         # Make read-only after editing
         text_widget.config(state=tk.DISABLED)
 
     def _check_for_updates(self):
         """Check for application updates - using background thread"""
+        S = self._ui_strings()
+
         try:
             # Show checking dialog
-            checking_title = self.translator.translate("settings_tab", "checking_update") or "Checking for Updates"
-            checking_message = self.translator.translate("settings_tab", "checking_for_updates") or "Checking for updates, please wait..."
+            checking_title = S["checking_update"]
+            checking_message = S["checking_for_updates"]
 
             progress_window = tk.Toplevel(self.frame)
             progress_window.title(checking_title)
@@ -575,8 +624,8 @@ class SettingsTab:
             )
             cancel_button.pack(pady=5)
 
-            # Update UI
-            self.frame.update_idletasks()
+            # Shared client so keep-alive connections are reused between checks
+            client = self.app.http
 
             # Create a function to run in background thread
             def check_update_thread():
@@ -585,7 +634,7 @@ class SettingsTab:
 
                 try:
                     update_check_url = self.update_check_url
-                    version_response = httpx.get(update_check_url, timeout=5.0)
+                    version_response = client.get(update_check_url)
                     version_response.raise_for_status()
                     result = version_response.json()
                 except Exception as e:
@@ -595,11 +644,11 @@ class SettingsTab:
                 # Update UI in the main thread
                 self.frame.after(0, lambda: self._process_update_result(progress_window, result, error))
 
-            # Start the background thread
-            threading.Thread(target=check_update_thread, daemon=True).start()
+            # Run on the app's persistent I/O worker
+            self.app.io_executor.submit(check_update_thread)
 
         except Exception as e:
-            error_title = self.translator.translate("settings_tab", "error") or "Error"
+            error_title = S["error"]
             error_message = self.translator.translate("settings_tab", "update_check_error") or "Error checking for updates: {error}"
 
             logging.error(f"Error setting up update check: {str(e)}")
@@ -610,12 +659,14 @@ class SettingsTab:
 
     def _process_update_result(self, progress_window, result, error):
         """Process update check results"""
+        S = self._ui_strings()
+
         # Close progress window if it still exists
         if progress_window and progress_window.winfo_exists():
             progress_window.destroy()
 
         if error:
-            error_title = self.translator.translate("settings_tab", "error") or "Error"
+            error_title = S["error"]
             error_message = self.translator.translate("settings_tab", "update_check_error") or "Error checking for updates: {error}"
 
             messagebox.showerror(
@@ -634,7 +685,7 @@ class SettingsTab:
                 self._show_no_update_needed()
 
         except Exception as e:
-            error_title = self.translator.translate("settings_tab", "error") or "Error"
+            error_title = S["error"]
             error_message = self.translator.translate("settings_tab", "update_check_error") or "Error processing update check results: {error}"
 
             logging.error(f"Error processing update check: {str(e)}")
@@ -653,24 +704,26 @@ class SettingsTab:
         Returns:
             int: 1 if ver1 > ver2, -1 if ver1 < ver2, 0 if equal
         """
-        def normalize(v):
-            return [int(x) for x in re.sub(r'(\.0+)*$', '', v).split(".")]
-
-        ver1_parts = normalize(ver1)
-        ver2_parts = normalize(ver2)
-
-        for v1, v2 in zip(ver1_parts, ver2_parts):
-            if v1 > v2:
-                return 1
-            if v1 < v2:
-                return -1
-
-        if len(ver1_parts) > len(ver2_parts):
-            return 1
-        elif len(ver1_parts) < len(ver2_parts):
-            return -1
-        else:
-            return 0
+        a, b = _normalize_version(ver1), _normalize_version(ver2)
+        return (a > b) - (a < b)
+
+    def _build_update_message(self, latest_version):
+        """Format the update available message (memoized as _format_update_message)
+
+        Args:
+            latest_version: Latest available version
+
+        Returns:
+            str: Message describing the current and latest versions
+        """
+        update_message_template = self.translator.translate(
+            "settings_tab", "update_message"
+        ) or "Current version: {current_version}\nLatest version: {latest_version}\n\nIt is recommended to upgrade to the latest version for new features and fixes."
+
+        return update_message_template.format(
+            current_version=self.current_version,
+            latest_version=latest_version
+        )
 
     def _show_update_available(self, version_data):
         """Show update available dialog
@@ -678,17 +731,16 @@ class SettingsTab:
         Args:
             version_data: Version information data
         """
+        S = self._ui_strings()
+
         latest_version = version_data.get('latest_version', self.current_version)
         download_url = version_data.get('download_url', '')
 
         # Get translated text
-        update_title = self.translator.translate("settings_tab", "update_available") or "Update Available"
-        update_header = self.translator.translate("settings_tab", "update_available_title") or "New Version Available!"
-        update_message_template = self.translator.translate(
-            "settings_tab", "update_message"
-        ) or "Current version: {current_version}\nLatest version: {latest_version}\n\nIt is recommended to upgrade to the latest version for new features and fixes."
-        download_button_text = self.translator.translate("settings_tab", "download_update") or "Download Update"
-        close_button_text = self.translator.translate("settings_tab", "close_button") or "Close"
+        update_title = S["update_available"]
+        update_header = S["update_available_title"]
+        download_button_text = S["download_update"]
+        close_button_text = S["close_button"]
 
         update_window = tk.Toplevel(self.frame)
         update_window.title(update_title)
@@ -707,10 +759,7 @@ class SettingsTab:
         header.pack(pady=(0, 15))
 
         # Version information
-        info_text = update_message_template.format(
-            current_version=self.current_version,
-            latest_version=latest_version
-        )
+        info_text = self._format_update_message(latest_version)
         info_label = ttk.Label(frame, text=info_text, wraplength=350, justify=tk.LEFT)
         info_label.pack(pady=10)
 
@@ -738,7 +787,9 @@ class SettingsTab:
 
     def _show_no_update_needed(self):
         """Show no update needed dialog"""
-        title = self.translator.translate("settings_tab", "version_check") or "Version Check"
+        S = self._ui_strings()
+
+        title = S["version_check"]
         message_template = self.translator.translate(
             "settings_tab", "no_update_needed"
         ) or "Current version ({version}) is up to date."
@@ -762,6 +813,19 @@ class SettingsTab:
         self.language_var.set(language_code)
         logging.info(f"Updated language_var to: {language_code}")
 
+    def _ui_strings(self):
+        """Get the fixed UI strings for the current language
+
+        Returns:
+            dict: Translation key -> translated text (or its fallback)
+        """
+        language = self.translator.language
+        strings = SettingsTab._STRING_CACHE.get(language)
+        if strings is None:
+            strings = {key: self.translator.translate("settings_tab", key) or fallback for key, fallback in _UI_STRING_KEYS}
+            SettingsTab._STRING_CACHE[language] = strings
+        return strings
+
     def _toggle_show_password(self, entry_widget):
         """Toggle password display/hiding"""
         if entry_widget.cget('show') == '*':
@@ -742,111 +742,115 @@ class UserTab:
         # Update ETA initially
         self._update_eta(0, total)
 
-        for i, item in enumerate(selected_items):
-            # Store current item index for UI updates
-            self.current_item_index = i
-
-            # Get video ID from item tag
-            aweme_id = self.videos_tree.item(item, "tags")[0]
-
-            # Get item description from values
-            item_desc = self.videos_tree.item(item, "values")[0]
-            if not item_desc or item_desc == self.translator.translate("user_tab", "no_description"):
-                item_desc = f"{self.translator.translate('user_tab', 'item')} {i + 1}"
-
-            # Truncate description if too long
-            if len(item_desc) > 40:
-                item_desc = item_desc[:37] + "..."
-
-            # Update UI
-            self._update_progress(i, total)
-            self._update_current_item(f"{item_desc}")
-            self.app.main_window.update_status(
-                f"{self.translator.translate('user_tab', 'processing_video')} {i + 1}/{total}: {aweme_id}")
-
-            # Track this item's start time for speed calculation
-            item_start_time = time.time()
-
-            # Find the video in the user videos list
-            video_info = None
-            for video in self.user_videos:
-                if video.get('aweme_id') == aweme_id:
-                    video_info = video
-                    break
-
-            if not video_info:
-                failed += 1
-                continue
-
-            # Check media type
-            media_type = media_type_codes.get(video_info.get('aweme_type', 0), 'video')
-
-            try:
-                # Prepare data structure based on media type
-                if media_type == 'video':
-                    # Get play URLs
-                    play_url = self._get_play_url_from_video(video_info)
-                    if not play_url:
-                        failed += 1
-                        continue
-
-                    # Structure data for downloader
-                    structured_data = {
-                        'id': video_info.get('aweme_id', ''),
-                        'desc': video_info.get('desc', ''),
-                        'author_name': video_info.get('author', {}).get('nickname', ''),
-                        'author_id': video_info.get('author', {}).get('uid', ''),
-                        'platform': self.user_platform,
-                        'media_type': 'video',
-                        'create_time': video_info.get('create_time', ''),
-                        'video_urls': play_url if isinstance(play_url, list) else [play_url]
-                    }
-
-                else:  # Image or album
-                    # Get image URLs
-                    image_urls = self._get_image_url_from_video(video_info)
-                    if not image_urls:
-                        failed += 1
-                        continue
-
-                    # Structure data for downloader
-                    structured_data = {
-                        'id': video_info.get('aweme_id', ''),
-                        'desc': video_info.get('desc', ''),
-                        'author_name': video_info.get('author', {}).get('nickname', ''),
-                        'author_id': video_info.get('author', {}).get('uid', ''),
-                        'platform': self.user_platform,
-                        'media_type': 'image',
-                        'create_time': video_info.get('create_time', ''),
-                        'image_urls': image_urls
-                    }
-
-                # Download using main_downloader
-                result = downloader.main_downloader(
-                    structured_data,
-                    output_dir=user_folder,
-                    max_retries=3
-                )
-
-                # Check result
-                if result['success'] and result['files']:
-                    completed += 1
-                    # Calculate download speed
-                    item_time = time.time() - item_start_time
-                    if item_time > 0:
-                        # Keep only the last 5 speeds for a moving average
-                        self.download_speed.append(1 / item_time)
-                        if len(self.download_speed) > 5:
-                            self.download_speed.pop(0)
-                else:
+        try:
+            for i, item in enumerate(selected_items):
+                # Store current item index for UI updates
+                self.current_item_index = i
+
+                # Get video ID from item tag
+                aweme_id = self.videos_tree.item(item, "tags")[0]
+
+                # Get item description from values
+                item_desc = self.videos_tree.item(item, "values")[0]
+                if not item_desc or item_desc == self.translator.translate("user_tab", "no_description"):
+                    item_desc = f"{self.translator.translate('user_tab', 'item')} {i + 1}"
+
+                # Truncate description if too long
+                if len(item_desc) > 40:
+                    item_desc = item_desc[:37] + "..."
+
+                # Update UI
+                self._update_progress(i, total)
+                self._update_current_item(f"{item_desc}")
+                self.app.main_window.update_status(
+                    f"{self.translator.translate('user_tab', 'processing_video')} {i + 1}/{total}: {aweme_id}")
+
+                # Track this item's start time for speed calculation
+                item_start_time = time.time()
+
+                # Find the video in the user videos list
+                video_info = None
+                for video in self.user_videos:
+                    if video.get('aweme_id') == aweme_id:
+                        video_info = video
+                        break
+
+                if not video_info:
                     failed += 1
+                    continue
+
+                # Check media type
+                media_type = media_type_codes.get(video_info.get('aweme_type', 0), 'video')
+
+                try:
+                    # Prepare data structure based on media type
+                    if media_type == 'video':
+                        # Get play URLs
+                        play_url = self._get_play_url_from_video(video_info)
+                        if not play_url:
+                            failed += 1
+                            continue
+
+                        # Structure data for downloader
+                        structured_data = {
+                            'id': video_info.get('aweme_id', ''),
+                            'desc': video_info.get('desc', ''),
+                            'author_name': video_info.get('author', {}).get('nickname', ''),
+                            'author_id': video_info.get('author', {}).get('uid', ''),
+                            'platform': self.user_platform,
+                            'media_type': 'video',
+                            'create_time': video_info.get('create_time', ''),
+                            'video_urls': play_url if isinstance(play_url, list) else [play_url]
+                        }
+
+                    else:  # Image or album
+                        # Get image URLs
+                        image_urls = self._get_image_url_from_video(video_info)
+                        if not image_urls:
+                            failed += 1
+                            continue
+
+                        # Structure data for downloader
+                        structured_data = {
+                            'id': video_info.get('aweme_id', ''),
+                            'desc': video_info.get('desc', ''),
+                            'author_name': video_info.get('author', {}).get('nickname', ''),
+                            'author_id': video_info.get('author', {}).get('uid', ''),
+                            'platform': self.user_platform,
+                            'media_type': 'image',
+                            'create_time': video_info.get('create_time', ''),
+                            'image_urls': image_urls
+                        }
+
+                    # Download using main_downloader
+                    result = downloader.main_downloader(
+                        structured_data,
+                        output_dir=user_folder,
+                        max_retries=3
+                    )
+
+                    # Check result
+                    if result['success'] and result['files']:
+                        completed += 1
+                        # Calculate download speed
+                        item_time = time.time() - item_start_time
+                        if item_time > 0:
+                            # Keep only the last 5 speeds for a moving average
+                            self.download_speed.append(1 / item_time)
+                            if len(self.download_speed) > 5:
+                                self.download_speed.pop(0)
+                    else:
+                        failed += 1
 
-                # Update ETA
-                self._update_eta(i + 1, total)
+                    # Update ETA
+                    self._update_eta(i + 1, total)
 
-            except Exception as e:
-                print(f"Error downloading video {aweme_id}: {e}")
-                failed += 1
+                except Exception as e:
+                    print(f"Error downloading video {aweme_id}: {e}")
+                    failed += 1
+        finally:
+            # 释放下载器占用的资源
+            downloader.close()
 
         # Final progress update
         self._update_progress(total, total)
@@ -1590,6 +1594,9 @@ class UserTab:
         except Exception as e:
             print(f"Error in single download thread: {e}")
             return False, None
+        finally:
+            # 释放下载器占用的资源
+            downloader.close()
 
     def _on_single_download_complete(self, result):
         """Handle completion of single download
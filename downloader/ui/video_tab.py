@@ -285,11 +285,15 @@ class VideoTab:
 
             # 直接使用main_downloader下载
             self.logger.info("Starting download with VideoDownloader")
-            result = downloader.main_downloader(
-                video_info,  # 直接传入整个video_info
-                progress_callback=progress_callback,
-                max_retries=settings.get('max_retries', 3)
-            )
+            try:
+                result = downloader.main_downloader(
+                    video_info,  # 直接传入整个video_info
+                    progress_callback=progress_callback,
+                    max_retries=settings.get('max_retries', 3)
+                )
+            finally:
+                # 释放下载器占用的资源
+                downloader.close()
 
             # 检查下载结果
             if result['success'] and result['files']:
@@ -1,6 +1,8 @@
+import atexit
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 
 class Logger:
@@ -22,7 +24,11 @@ class Logger:
             self._setup_handlers(log_file, max_size, backup_count)
 
     def _setup_handlers(self, log_file, max_size, backup_count):
-        """设置日志输出到控制台 & 滚动文件"""
+        """设置日志输出到控制台 & 滚动文件
+
+        记录时只把日志放入队列，由后台监听线程写控制台和文件，
+        下载工作线程不会因为 stdout / 文件 I/O 而互相阻塞
+        """
         formatter = logging.Formatter(
             "%(asctime)s - [%(levelname)s] - (%(filename)s:%(lineno)d) - %(message)s"
         )
@@ -30,12 +36,17 @@ class Logger:
         # ✅ 1️⃣ 控制台日志
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
 
         # ✅ 2️⃣ 文件日志（支持日志滚动）
         file_handler = RotatingFileHandler(log_file, maxBytes=max_size, backupCount=backup_count, encoding="utf-8")
         file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
+
+        # ✅ 3️⃣ 队列转发：记录端只做入队，真正的输出在监听线程中完成
+        log_queue = queue.SimpleQueue()
+        self.listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+        self.listener.start()
+        atexit.register(self.listener.stop)  # 退出时写完队列中剩余的日志
+        self.logger.addHandler(QueueHandler(log_queue))
 
     def get_logger(self):
         """获取日志记录器"""
@@ -10,6 +10,23 @@ import subprocess
 import urllib.parse
 from urllib.parse import urlparse, parse_qs, urlunparse, urlencode
 
+# Splits digit runs out of a string for natural ordering
+_NUMBER_SPLIT_PATTERN = re.compile(r'(\d+)')
+
+# URL 提取的正则表达式模式（模块加载时编译一次）
+# 这个正则表达式被设计为尽可能准确且覆盖大多数 URL 场景；各部分都有长度上限，
+# 不存在嵌套量词，因此不会出现灾难性回溯
+_URL_PATTERN = re.compile(
+    r'(?:(?:https?:\/\/|www\.)?' +  # 可选的协议和 www
+    r'(?:[-a-zA-Z0-9@:%._+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b)' +  # 域名
+    r'(?:\/[-a-zA-Z0-9()@:%_+.~#?&\/=]*)?)',  # 可选的路径和查询参数
+    re.IGNORECASE
+)
+
+# extract_and_clean_url 使用的模式
+_HTTP_URL_PATTERN = re.compile(r'https?://[^\s)]+')
+_TRACKING_PARAM_PATTERN = re.compile(r'utm_|fbclid|gclid|ref')
+
 
 def sanitize_filename(name, max_length=255):
     """Remove invalid characters from filename and limit length
@@ -34,6 +51,20 @@ def sanitize_filename(name, max_length=255):
     return sanitized
 
 
+def natural_sort_key(name):
+    """Build a sort key that orders embedded numbers numerically
+
+    e.g. "img_2.jpg" sorts before "img_10.jpg"
+
+    Args:
+        name: The string to build a key for
+
+    Returns:
+        list: Alternating text and integer parts
+    """
+    return [int(part) if part.isdigit() else part.lower() for part in _NUMBER_SPLIT_PATTERN.split(name)]
+
+
 def open_folder(path):
     """Open a folder in the system file explorer
 
@@ -103,29 +134,26 @@ def extract_urls_from_text(text):
     if not text or not isinstance(text, str):
         return []
 
-    # 定义 URL 提取的正则表达式模式
-    # 这个正则表达式被设计为尽可能准确且覆盖大多数 URL 场景
-    url_pattern = re.compile(
-        r'(?:(?:https?:\/\/|www\.)?' +  # 可选的协议和 www
-        r'(?:[-a-zA-Z0-9@:%._+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b)' +  # 域名
-        r'(?:\/[-a-zA-Z0-9()@:%_+.~#?&\/=]*)?)',  # 可选的路径和查询参数
-        re.IGNORECASE
-    )
+    # 预过滤：规范化后的有效 URL 必然包含 '://' 或以 'www.' 开头，且 URL 不含空白，
+    # 因此按空白切分后只保留含这两个标记的片段，其余文字（分享文案等）不进入正则匹配
+    candidates = [token for token in text.split() if '://' in token or 'www.' in token]
+    if not candidates:
+        return []
 
     # 提取所有匹配的 URL
-    urls = url_pattern.findall(text)
+    urls = _URL_PATTERN.findall('\n'.join(candidates))
 
-    # 处理和验证 URL
-    validated_urls = []
+    # 处理和验证 URL（dict 保持插入顺序，去重为 O(1) 查找）
+    validated_urls = {}
     for url in urls:
         # 规范化 URL
         normalized_url = _normalize_url(url)
 
         # 验证 URL 并去重
-        if normalized_url and normalized_url not in validated_urls:
-            validated_urls.append(normalized_url)
+        if normalized_url:
+            validated_urls[normalized_url] = None
 
-    return validated_urls
+    return list(validated_urls)
 
 
 def _normalize_url(url):
@@ -190,6 +218,43 @@ def extract_urls_from_line_text(text):
     return extract_urls_from_text(text)
 
 
+# 分享链接中常见的追踪参数（不影响指向的作品，去重时忽略）
+_TRACKING_PARAMS = frozenset({
+    'fbclid', 'gclid', '_t', '_r', '_d', 'u_code', 'did', 'iid', 'timestamp',
+    'previous_page', 'is_from_webapp', 'sender_device', 'web_id', 'checksum',
+})
+_TRACKING_PARAM_PREFIXES = ('utm_', 'share_')
+
+
+def normalize_share_url(url):
+    """
+    规范化分享链接用于去重：域名转小写、去除追踪参数，保留路径和其余查询参数
+
+    Args:
+        url (str): 待规范化的 URL
+
+    Returns:
+        str: 规范化后的 URL
+    """
+    url = url.strip()
+    parts = urllib.parse.urlsplit(url)
+    if not parts.query:
+        return urllib.parse.urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, '', ''))
+
+    query = [
+        (key, value)
+        for key, value in urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+        if key not in _TRACKING_PARAMS and not key.startswith(_TRACKING_PARAM_PREFIXES)
+    ]
+    return urllib.parse.urlunsplit((
+        parts.scheme,
+        parts.netloc.lower(),
+        parts.path,
+        urllib.parse.urlencode(query),
+        ''
+    ))
+
+
 def extract_and_clean_url(text: str) -> str:
     """Extract and clean URLs from the input text.
 
@@ -201,8 +266,7 @@ def extract_and_clean_url(text: str) -> str:
     """
     try:
         # 正则匹配 URL（支持 http/https）
-        url_pattern = r'https?://[^\s)]+'
-        urls = re.findall(url_pattern, text)
+        urls = _HTTP_URL_PATTERN.findall(text)
 
         if not urls:
             return text  # 没有找到 URL，返回原始文本
@@ -215,7 +279,7 @@ def extract_and_clean_url(text: str) -> str:
 
         # 解析查询参数，并去掉不必要的追踪参数
         query_params = parse_qs(parsed_url.query)
-        cleaned_params = {k: v for k, v in query_params.items() if not re.match(r'utm_|fbclid|gclid|ref', k)}
+        cleaned_params = {k: v for k, v in query_params.items() if not _TRACKING_PARAM_PATTERN.match(k)}
 
         # 重新构造 URL
         cleaned_query = urlencode(cleaned_params, doseq=True)